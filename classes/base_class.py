@@ -3,6 +3,9 @@ Updated Base Class with improved parameter handling
 """
 
 class BaseClass:
+    # Per-class cache for get_dialog_param_spec()
+    _dialog_param_specs = {}
+    
     def __init__(self, id, database):
         self.section = "Base"
         self.id = id
@@ -151,6 +154,23 @@ class BaseClass:
         
         return list(self.available_parameters[destination].keys())
     
+    def get_dialog_param_spec(self):
+        """Get (param_key, editable, required) for non-calculated dialog parameters.
+        Parameter metadata is the same for every instance, so this is computed once per class.
+        """
+        cls = type(self)
+        spec = BaseClass._dialog_param_specs.get(cls)
+        if spec is None:
+            spec = tuple(
+                (param_key,
+                 self.is_parameter_editable(param_key, "dialog"),
+                 bool(self.parameters[param_key].get('required', False)))
+                for param_key in self.get_visible_parameters("dialog")
+                if param_key in self.parameters and not self.is_parameter_calculated(param_key)
+            )
+            BaseClass._dialog_param_specs[cls] = spec
+        return spec
+    
     def is_parameter_calculated(self, param_key):
         """Check if parameter is calculated (has method)"""
         if param_key not in self.parameters:
@@ -214,15 +234,15 @@ class BaseClass:
             return False
         
         try:
-            items = self.database.get_items(self.section)
-            for item in items:
-                if item.get('ID') == self.id:
-                    # Load values from database item
-                    for param_key in self.parameters:
-                        if param_key in item and not self.is_parameter_calculated(param_key):
-                            self.set_value(param_key, item[param_key])
-                    return True
-            return False
+            item = self.database.get_item(self.id, self.section)
+            if not item:
+                return False
+            
+            # Load values from database item
+            for param_key in self.parameters:
+                if param_key in item and not self.is_parameter_calculated(param_key):
+                    self.set_value(param_key, item[param_key])
+            return True
         except Exception as e:
             print(f"Error loading data for {self.section} {self.id}: {e}")
             return False
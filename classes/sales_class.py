@@ -2,6 +2,8 @@
 Sales Class - Updated to handle multiple items per sales operation
 Example showing new parameter types: date, table
 """
+from operator import itemgetter
+
 from classes.base_class import BaseClass
 from classes.sales_item_class import SalesItemClass
 
@@ -226,8 +228,8 @@ class SalesClass(BaseClass):
         
         try:
             self.database.cursor.execute("SELECT username FROM Clients WHERE username IS NOT NULL AND username != '' ORDER BY username")
-            results = self.database.cursor.fetchall()
-            return [row[0] for row in results if row[0]]
+            # Query already excludes NULL/empty usernames, so just take the first column
+            return list(map(itemgetter(0), self.database.cursor.fetchall()))
         except Exception as e:
             print(f"Error getting client username options: {e}")
             return []
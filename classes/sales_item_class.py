@@ -2,6 +2,8 @@
 Sales Item Class - Represents individual items within a sales operation
 Updated example showing button parameter for delete actions
 """
+from operator import itemgetter
+
 from classes.base_class import BaseClass
 
 
@@ -127,7 +129,7 @@ class SalesItemClass(BaseClass):
             return []
         try:
             self.database.cursor.execute("SELECT name FROM Products WHERE name IS NOT NULL AND name != '' ORDER BY name")
-            return [r[0] for r in self.database.cursor.fetchall() if r[0]]
+            return list(map(itemgetter(0), self.database.cursor.fetchall()))
         except Exception:
             return []
     
@@ -200,25 +200,25 @@ class SupplierClass(BaseClass):
         
         try:
             # Get raw data from database
-            items = self.database.get_items("Suppliers")
-            for item in items:
-                if str(item.get('ID', '')) == str(self.id):
-                    # Load all non-calculated parameters
-                    for param_key in self.parameters:
-                        if not self.is_parameter_calculated(param_key) and param_key in item:
-                            try:
-                                # Handle field name mapping if needed
-                                if param_key == 'id':
-                                    value = item.get('ID', 0)
-                                else:
-                                    value = item.get(param_key)
-                                
-                                if value is not None:
-                                    self.set_value(param_key, value)
-                            except (KeyError, ValueError) as e:
-                                print(f"Warning: Could not load {param_key}: {e}")
-                    return True
-            return False
+            item = self.database.get_item(self.id, "Suppliers")
+            if not item:
+                return False
+            
+            # Load all non-calculated parameters
+            for param_key in self.parameters:
+                if not self.is_parameter_calculated(param_key) and param_key in item:
+                    try:
+                        # Handle field name mapping if needed
+                        if param_key == 'id':
+                            value = item.get('ID', 0)
+                        else:
+                            value = item.get(param_key)
+                        
+                        if value is not None:
+                            self.set_value(param_key, value)
+                    except (KeyError, ValueError) as e:
+                        print(f"Warning: Could not load {param_key}: {e}")
+            return True
                 
         except Exception as e:
             print(f"Error loading supplier data for ID {self.id}: {e}")
@@ -578,6 +578,55 @@ class Database:
             print(f"Error adding item to {section}: {e}")
             return None
     
+    def replace_items_by_operation_id(self, operation_id, rows, section):
+        """Replace all items of an operation (Sales_Items or Import_Items) in a single transaction.
+        Returns how many rows were added, or None if nothing was changed because of an error."""
+        if not self.cursor or section not in self.registered_classes:
+            return None
+        
+        # Determine the foreign key column name based on section
+        if section == 'Sales_Items':
+            fk_column = 'sales_id'
+        elif section == 'Import_Items':
+            fk_column = 'import_id'
+        else:
+            print(f"Unknown item section: {section}")
+            return None
+        
+        try:
+            self.cursor.execute(f"DELETE FROM '{section}' WHERE {fk_column} = ?", (operation_id,))
+            count = self._insert_rows(rows, section) if rows else 0
+            self.conn.commit()
+            return count
+            
+        except Exception as e:
+            self.conn.rollback()
+            print(f"Error replacing items in {section} for operation {operation_id}: {e}")
+            return None
+    
+    def _insert_rows(self, rows, section):
+        """Insert rows with one executemany (no commit) and return how many were inserted"""
+        # Get parameters that should be stored (same filtering as add_item)
+        cls = self.registered_classes[section]
+        temp_obj = cls(0, None)
+        columns = [
+            key for key in temp_obj.get_visible_parameters("database")
+            if not temp_obj.is_parameter_calculated(key) and any(key in row for row in rows)
+        ]
+        
+        if not columns:
+            return 0
+        
+        # Build one INSERT query and run it for every row
+        columns_str = "', '".join(columns)
+        placeholders_str = ", ".join(['?' for _ in columns])
+        
+        sql = f"INSERT INTO '{section}' ('{columns_str}') VALUES ({placeholders_str})"
+        values = [tuple(row.get(key) for key in columns) for row in rows]
+        
+        self.cursor.executemany(sql, values)
+        return len(values)
+    
     def update_item(self, item_id, data, section):
         """Update item in database"""
         if not self.cursor or section not in self.registered_classes:
@@ -634,6 +683,25 @@ class Database:
             print(f"Error getting items from {section}: {e}")
             return []
     
+    def get_item(self, item_id, section):
+        """Get a single item from section by ID (None if not found)"""
+        if not self.cursor or section not in self.registered_classes:
+            return None
+        
+        try:
+            self.cursor.execute(f"SELECT * FROM '{section}' WHERE ID = ?", (item_id,))
+            row = self.cursor.fetchone()
+            if row is None:
+                return None
+            
+            # Get column names
+            columns = [description[0] for description in self.cursor.description]
+            return dict(zip(columns, row))
+            
+        except Exception as e:
+            print(f"Error getting item {item_id} from {section}: {e}")
+            return None
+    
     def get_items_by_operation_id(self, operation_id, section):
         """Get items for a specific operation (Sales_Items or Import_Items)"""
         if not self.cursor or section not in self.registered_classes:
@@ -3,9 +3,38 @@ Profile management module for handling profiles.
 """
 import os
 import json
+import copy
 import shutil
 import time
 import sqlite3
+from functools import lru_cache
+
+
+def _read_config_json(config_path, stat):
+    """Parse a profile config.json, reusing the parse while the file is unchanged.
+    Callers get their own copy, so changing it never alters the cached parse."""
+    return copy.deepcopy(_parse_config_json(config_path, stat.st_ino, stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=64)
+def _parse_config_json(config_path, inode, mtime_ns, size):
+    """Parse config_path once per (inode, mtime, size).
+    save_to_config replaces the file through a rename, so every save gets a new inode
+    even within one coarse mtime tick; it also clears this cache. Only an outside
+    same-size in-place edit within one mtime tick could still be missed."""
+    with open(config_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=8)
+def _dialog_param_labels(language):
+    """(param_key, display_name) pairs for the dialog parameters in one language (built once per language)"""
+    profile = ProfileClass("")
+    return tuple(
+        (param_key, profile.get_display_name(param_key, language))
+        for param_key in profile.available_parameters["dialog"]
+    )
+
 
 class ProfileManager:
     def __init__(self):
@@ -208,8 +237,9 @@ class ProfileManager:
         """Get list of available profiles"""
         return list(self.available_profiles.keys())
     
-    def duplicate_profile(self, source_name, new_name):
-        """Duplicate an existing profile with a new name"""
+    def duplicate_profile(self, source_name, new_name, values=None, encrypted_phrase=None):
+        """Duplicate an existing profile with a new name.
+        values and encrypted_phrase override the copied ones, so the config is written once."""
         if source_name not in self.available_profiles:
             raise ValueError(f"Source profile '{source_name}' not found")
         
@@ -247,6 +277,10 @@ class ProfileManager:
         
         # Load and update the config
         new_profile.load_config_data()
+        if values:
+            new_profile.set_values(values)
+        if encrypted_phrase:
+            new_profile.encrypted_phrase = encrypted_phrase
         
         # Copy and modify database (only specific tables)
         source_db = os.path.join(source_dir, f"{source_name}.db")
@@ -372,6 +406,10 @@ class ProfileClass:
         param_data = self.parameters.get(param_key, {})
         display_names = param_data.get("display name", {})
         return display_names.get(language, param_key)  # Fallback to key if language not found
+    
+    def get_dialog_labels(self, language):
+        """Get (param_key, display_name) pairs for the dialog parameters, in display order"""
+        return _dialog_param_labels(language)
         
     def set_value(self, param_key, value):
         if param_key in self.parameters:
@@ -396,8 +434,9 @@ class ProfileClass:
         
         for attempt in range(max_retries):
             try:
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                # Parsed config is reused across profile reloads while the file is unchanged
+                stat = os.stat(self.config_path)
+                data = _read_config_json(self.config_path, stat)
                 
                 # Load parameter values
                 for key in self.parameters:
@@ -454,6 +493,7 @@ class ProfileClass:
                 else:  # Unix-like systems
                     os.rename(temp_path, self.config_path)
                 
+                _parse_config_json.cache_clear()  # Never serve a parse from before this write
                 return  # Success, exit retry loop
                 
             except (OSError, IOError) as e:
@@ -6,6 +6,7 @@ from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QGuiApplication, QIcon
 from ui.main_window import MainWindow
+from ui.theme import DARK_QSS
 
 
 def main():
@@ -13,6 +14,7 @@ def main():
     app = QApplication(sys.argv)
     app.setWindowIcon(QIcon("logo.png"))
     QGuiApplication.styleHints().setColorScheme(Qt.ColorScheme.Dark)
+    app.setStyleSheet(DARK_QSS)
 
     # Create and show main window
     window = MainWindow()
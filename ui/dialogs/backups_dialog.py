@@ -12,6 +12,30 @@ from datetime import datetime
 from ui.widgets.themed_widgets import RedButton, GreenButton, BlueButton
 from ui.widgets.cards_list import GridCardsList
 
+
+# Dark theme - defined once here instead of rebuilt in every setup_ui() call
+_DARK_QSS = """
+    QDialog {
+        background-color: #2b2b2b;
+        color: #ffffff;
+    }
+    QLabel {
+        color: #ffffff;
+    }
+    QInputDialog {
+        background-color: #2b2b2b;
+        color: #ffffff;
+    }
+    QLineEdit {
+        background-color: #404040;
+        border: 1px solid #555555;
+        padding: 5px;
+        color: #ffffff;
+    }
+"""
+_HEADER_QSS = "color: #ffffff; font-size: 18px; font-weight: bold;"
+
+
 class BackupsDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -33,32 +57,14 @@ class BackupsDialog(QDialog):
     
     def setup_ui(self):
         """Setup the UI components"""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            QLabel {
-                color: #ffffff;
-            }
-            QInputDialog {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            QLineEdit {
-                background-color: #404040;
-                border: 1px solid #555555;
-                padding: 5px;
-                color: #ffffff;
-            }
-        """)
+        self.setStyleSheet(_DARK_QSS)
         
         # Main vertical layout
         layout = QVBoxLayout()
 
         # Header
         header_label = QLabel("Database Backups")
-        header_label.setStyleSheet("color: #ffffff; font-size: 18px; font-weight: bold;")
+        header_label.setStyleSheet(_HEADER_QSS)
         layout.addWidget(header_label)
 
         # Cards list for backups
@@ -0,0 +1,32 @@
+"""
+Contact field validators shared by the client and supplier edit dialogs.
+Plain functions so bulk paths (imports, CSV) can call them without a dialog.
+"""
+
+import re
+
+
+# Domain is matched label by label so the dot-separated parts cannot overlap
+_EMAIL_RE = re.compile(r'[A-Za-z0-9._%+\-]+@[A-Za-z0-9\-]+(?:\.[A-Za-z0-9\-]+)*\.[A-Za-z]{2,}')
+_EMAIL_MAX_LENGTH = 254  # RFC 5321 limit on a forward path
+_PHONE_STRIP_TABLE = str.maketrans('', '', '+-()')  # Phone punctuation to delete (whitespace is split out first)
+
+
+def validate_email(email):
+    """Validate email format (empty email is allowed)"""
+    if not email:
+        return True
+    if len(email) > _EMAIL_MAX_LENGTH:
+        return False
+    # fullmatch, not match + '$': '$' also matches before a trailing newline
+    return _EMAIL_RE.fullmatch(email) is not None
+
+
+def validate_phone(phone):
+    """Validate phone format - digits plus spaces, hyphens, parentheses and '+' (empty phone is allowed)"""
+    if not phone:
+        return True
+    # Drop every Unicode space (no-break spaces from pasted/French numbers included), then the punctuation
+    cleaned_phone = ''.join(phone.split()).translate(_PHONE_STRIP_TABLE)
+    # What remains must be 7 to 15 characters (O(1) check first), all digits
+    return 7 <= len(cleaned_phone) <= 15 and cleaned_phone.isdigit()
@@ -11,6 +11,26 @@ from ui.widgets.themed_widgets import GreenButton, RedButton
 import os
 
 
+# Dark theme for edit dialogs - defined once here instead of rebuilt in every apply_theme() call
+_DARK_QSS = """
+    QDialog {
+        background-color: #2b2b2b;
+        color: #ffffff;
+    }
+    QLabel {
+        color: #ffffff;
+    }
+    QScrollArea {
+        background-color: #2b2b2b;
+        border: none;
+    }
+    QWidget {
+        background-color: #2b2b2b;
+        color: #ffffff;
+    }
+"""
+
+
 class BaseEditDialog(QDialog):
     """
     Universal dialog for editing any object using the parameter system
@@ -27,6 +47,7 @@ class BaseEditDialog(QDialog):
         self.data_object = data_object
         self.ui_config = ui_config or {}
         self.parameter_widgets = {}
+        self._widget_setters = {}  # param_key -> value setter, resolved when the widget is created
         
         # Set dialog properties
         self.setWindowTitle(f"Edit {self.data_object.section}")
@@ -56,26 +77,13 @@ class BaseEditDialog(QDialog):
         scroll_widget = QWidget()
         form_layout = QFormLayout(scroll_widget)
         
-        # Get parameters that should be shown in dialog
-        visible_params = self.data_object.get_visible_parameters("dialog")
+        # Get profile images directory
+        profile_images_dir = self.get_profile_images_dir()
         
-        # Create widgets for each visible parameter
-        for param_key in visible_params:
-            if param_key not in self.data_object.parameters:
-                continue
-            
+        # Create widgets for each visible, non-calculated parameter (spec is cached per class)
+        for param_key, editable, required in self.data_object.get_dialog_param_spec():
             param_info = self.data_object.parameters[param_key]
             
-            # Skip calculated parameters (they're read-only and calculated dynamically)
-            if self.data_object.is_parameter_calculated(param_key):
-                continue
-            
-            # Check if parameter is editable
-            editable = self.data_object.is_parameter_editable(param_key, "dialog")
-            
-            # Get profile images directory
-            profile_images_dir = self.get_profile_images_dir()
-            
             # Create appropriate widget (import locally to avoid circular imports)
             from ui.widgets.parameters_widgets import ParameterWidgetFactory
             widget = ParameterWidgetFactory.create_widget(
@@ -86,15 +94,16 @@ class BaseEditDialog(QDialog):
             )
             
             self.parameter_widgets[param_key] = widget
+            self._widget_setters[param_key] = ParameterWidgetFactory.get_value_setter(widget)
             
             # Get display name with language support
             display_name = self.data_object.get_display_name(param_key)
             
             # Add required indicator
-            if param_info.get('required', False):
+            if required:
                 display_name += " *"
             
-            form_layout.addRow(QLabel(display_name + ":"), widget)
+            form_layout.addRow(display_name + ":", widget)
         
         scroll_area.setWidget(scroll_widget)
         scroll_area.setWidgetResizable(True)
@@ -116,34 +125,38 @@ class BaseEditDialog(QDialog):
     
     def get_profile_images_dir(self):
         """Get profile images directory if available"""
-        try:
-            if (hasattr(self.parent(), 'profile_manager') and 
-                self.parent().profile_manager and
-                self.parent().profile_manager.selected_profile):
-                
-                profile_dir = os.path.dirname(self.parent().profile_manager.selected_profile.config_path)
-                return os.path.join(profile_dir, "images")
-        except:
-            pass
-        return None
+        profile_manager = getattr(self.parent(), 'profile_manager', None)
+        if not profile_manager or not profile_manager.selected_profile:
+            return None
+        
+        config_path = getattr(profile_manager.selected_profile, 'config_path', None)
+        if not config_path:
+            return None
+        
+        profile_dir = os.path.dirname(config_path)
+        return os.path.join(profile_dir, "images")
     
     def load_data(self):
         """Load current data into widgets"""
-        from ui.widgets.parameters_widgets import ParameterWidgetFactory
-        
-        for param_key, widget in self.parameter_widgets.items():
-            current_value = self.data_object.get_value(param_key)
-            ParameterWidgetFactory.set_widget_value(widget, current_value)
+        for param_key, set_value in self._widget_setters.items():
+            set_value(self.data_object.get_value(param_key))
     
-    def validate_data(self):
-        """Validate all parameters using base class validation"""
+    def _collect_form_values(self):
+        """Read every parameter widget once into a {param_key: value} dict"""
         from ui.widgets.parameters_widgets import ParameterWidgetFactory
+        return {
+            param_key: ParameterWidgetFactory.get_widget_value(widget)
+            for param_key, widget in self.parameter_widgets.items()
+        }
+    
+    def validate_data(self, values=None):
+        """Validate all parameters using base class validation (values: form values from _collect_form_values)"""
+        if values is None:
+            values = self._collect_form_values()
         
         errors = []
         
-        for param_key, widget in self.parameter_widgets.items():
-            value = ParameterWidgetFactory.get_widget_value(widget)
-            
+        for param_key, value in values.items():
             # Use base class validation but remove options validation
             param_info = self.data_object.parameters[param_key]
             
@@ -186,8 +199,9 @@ class BaseEditDialog(QDialog):
     
     def save_changes(self):
         """Validate and save changes"""
-        # Validate data
-        errors = self.validate_data()
+        # Validate data (form values are read once and reused for saving)
+        values = self._collect_form_values()
+        errors = self.validate_data(values)
         
         # Separate warnings from critical errors
         critical_errors = [e for e in errors if not e.lower().startswith('warning')]
@@ -211,10 +225,7 @@ class BaseEditDialog(QDialog):
         
         # Update data object
         try:
-            from ui.widgets.parameters_widgets import ParameterWidgetFactory
-            
-            for param_key, widget in self.parameter_widgets.items():
-                value = ParameterWidgetFactory.get_widget_value(widget)
+            for param_key, value in values.items():
                 self.data_object.set_value(param_key, value)
             
             # Save to database if method is available
@@ -231,23 +242,7 @@ class BaseEditDialog(QDialog):
     
     def apply_theme(self):
         """Apply dark theme"""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            QLabel {
-                color: #ffffff;
-            }
-            QScrollArea {
-                background-color: #2b2b2b;
-                border: none;
-            }
-            QWidget {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-        """)
+        self.setStyleSheet(_DARK_QSS)
 
 
 class DialogManager:
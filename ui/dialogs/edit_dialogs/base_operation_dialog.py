@@ -6,7 +6,7 @@ Replaces the complex manual layout calculations with clean auto-sizing
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                                QPushButton, QMessageBox, QScrollArea, QWidget,
                                QFormLayout, QSizePolicy)
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QSignalBlocker
 from PySide6.QtGui import QFont
 from ui.widgets.themed_widgets import GreenButton, RedButton
 from ui.widgets.operations_table import OperationsTableWidget
@@ -14,6 +14,22 @@ from ui.widgets.parameters_widgets import ParameterWidgetFactory
 from datetime import datetime
 
 
+# Dark theme stylesheet (module constant, shared by all operation dialogs)
+_DARK_QSS = """
+    QDialog {
+        background-color: #2b2b2b;
+        color: #ffffff;
+    }
+    QLabel {
+        color: #ffffff;
+    }
+    QWidget {
+        background-color: #2b2b2b;
+        color: #ffffff;
+    }
+"""
+
+
 class BaseOperationDialog(QDialog):
     """
     Unified dialog for operations (Sales, Imports) with automatic layout
@@ -85,23 +101,16 @@ class BaseOperationDialog(QDialog):
         form_layout = QFormLayout(form_widget)
         form_layout.setContentsMargins(5, 5, 5, 5)
         
-        # Get visible dialog parameters
-        visible_params = self.operation_obj.get_visible_parameters("dialog")
+        profile_images_dir = self.get_profile_images_dir()
         
-        for param_key in visible_params:
+        # Visible, non-calculated dialog parameters (spec is cached per class)
+        for param_key, editable, required in self.operation_obj.get_dialog_param_spec():
             if param_key == 'items':  # Skip items - handled separately
                 continue
                 
             param_info = self.operation_obj.parameters[param_key]
             
-            # Skip calculated parameters
-            if self.operation_obj.is_parameter_calculated(param_key):
-                continue
-            
             # Create widget
-            profile_images_dir = self.get_profile_images_dir()
-            editable = self.operation_obj.is_parameter_editable(param_key, "dialog")
-            
             widget = ParameterWidgetFactory.create_widget(
                 param_info, {}, profile_images_dir, editable
             )
@@ -130,10 +139,10 @@ class BaseOperationDialog(QDialog):
             
             # Add to form
             display_name = self.operation_obj.get_display_name(param_key)
-            if param_info.get('required', False):
+            if required:
                 display_name += " *"
             
-            form_layout.addRow(QLabel(display_name + ":"), widget)
+            form_layout.addRow(display_name + ":", widget)
         
         parent_layout.addWidget(form_widget)
     
@@ -219,19 +228,17 @@ class BaseOperationDialog(QDialog):
     
     def get_profile_images_dir(self):
         """Get profile images directory"""
-        try:
-            if (hasattr(self.parent(), 'profile_manager') and 
-                self.parent().profile_manager and
-                self.parent().profile_manager.selected_profile):
-                
-                import os
-                profile_dir = os.path.dirname(
-                    self.parent().profile_manager.selected_profile.config_path
-                )
-                return os.path.join(profile_dir, "images")
-        except:
-            pass
-        return None
+        profile_manager = getattr(self.parent(), 'profile_manager', None)
+        if not profile_manager or not profile_manager.selected_profile:
+            return None
+        
+        config_path = getattr(profile_manager.selected_profile, 'config_path', None)
+        if not config_path:
+            return None
+        
+        import os
+        profile_dir = os.path.dirname(config_path)
+        return os.path.join(profile_dir, "images")
     
     def load_data(self):
         """Load current data into widgets"""
@@ -242,11 +249,8 @@ class BaseOperationDialog(QDialog):
     def update_totals(self):
         """Update total calculation displays"""
         try:
-            # Get current items
-            items = self.items_table.get_items_data()
-            
-            # Calculate subtotal
-            subtotal = sum(item.get_value('subtotal') or 0 for item in items)
+            # Calculate subtotal straight from the table's subtotal column
+            subtotal = sum(self.items_table.get_subtotal_column())
             
             # Get VAT percentage
             vat_percent = 0
@@ -262,10 +266,10 @@ class BaseOperationDialog(QDialog):
             vat_amount = subtotal * (vat_percent / 100)
             total = subtotal + vat_amount
             
-            # Update displays
-            ParameterWidgetFactory.set_widget_value(self.subtotal_widget, subtotal)
-            ParameterWidgetFactory.set_widget_value(self.vat_widget, vat_amount)
-            ParameterWidgetFactory.set_widget_value(self.total_widget, total)
+            # Update displays (signals blocked - these are programmatic, read-only updates)
+            for widget, value in ((self.subtotal_widget, subtotal), (self.vat_widget, vat_amount), (self.total_widget, total)):
+                with QSignalBlocker(getattr(widget, 'spinbox', widget)):
+                    ParameterWidgetFactory.set_widget_value(widget, value)
             
         except Exception as e:
             print(f"Error updating totals: {e}")
@@ -341,18 +345,6 @@ class BaseOperationDialog(QDialog):
                 # Simple and robust: clear existing items, then insert current ones using item classes
                 operation_id = self.operation_obj.id
                 
-                # Delete all existing items for this operation
-                if self.operation_obj.section == "Sales" and hasattr(self.operation_obj, 'get_sales_items'):
-                    existing_items = self.operation_obj.get_sales_items()
-                    for item in existing_items:
-                        if getattr(item, 'id', 0):
-                            self.database.delete_item(item.id, "Sales_Items")
-                elif self.operation_obj.section == "Imports" and hasattr(self.operation_obj, 'get_import_items'):
-                    existing_items = self.operation_obj.get_import_items()
-                    for item in existing_items:
-                        if getattr(item, 'id', 0):
-                            self.database.delete_item(item.id, "Import_Items")
-                
                 # Recreate items from the table using item classes (ensures product_name -> product_id mapping)
                 # First collect items (may still lack product_id if something failed)
                 items_objects = self.items_table.get_items_data()
@@ -406,14 +398,34 @@ class BaseOperationDialog(QDialog):
                             if reply != QMessageBox.StandardButton.Yes:
                                 return
 
-                items_saved = 0
-                for item in items_objects:
+                # Rows untouched since load are already stored - skip the delete/re-insert round-trips
+                items_unchanged = (
+                    action == "updated" and
+                    not self.items_table.has_changes() and
+                    all(itm.get_value('product_id') for itm in items_objects)
+                )
+                
+                if items_unchanged:
+                    items_saved = len(items_objects)
+                else:
+                    # Replace existing items: one DELETE + one executemany in a single transaction
                     if self.operation_obj.section == "Sales":
-                        item.set_value('sales_id', operation_id)
-                    elif self.operation_obj.section == "Imports":
-                        item.set_value('import_id', operation_id)
-                    if item.save_to_database():
-                        items_saved += 1
+                        items_section, operation_key = "Sales_Items", 'sales_id'
+                    else:
+                        items_section, operation_key = "Import_Items", 'import_id'
+                    
+                    rows = []
+                    for item in items_objects:
+                        item.set_value(operation_key, operation_id)
+                        rows.append({
+                            param_key: item.get_value(param_key)
+                            for param_key in item.get_visible_parameters("database")
+                        })
+                    items_saved = self.database.replace_items_by_operation_id(operation_id, rows, items_section)
+                    if items_saved is None:
+                        # The transaction was rolled back: keep the dialog open so the user can retry
+                        QMessageBox.critical(self, "Error", "Failed to save operation items")
+                        return
                 
                 QMessageBox.information(self, "Success", f"Operation {action} successfully!\n{items_saved} items saved.")
                 self.accept()  # Close dialog successfully
@@ -425,19 +437,7 @@ class BaseOperationDialog(QDialog):
     
     def apply_theme(self):
         """Apply dark theme"""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            QLabel {
-                color: #ffffff;
-            }
-            QWidget {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-        """)
+        self.setStyleSheet(_DARK_QSS)
 
     # ────────────────── Warning-settings helpers ──────────────────────────── #
 
@@ -5,7 +5,7 @@ Client Dialog - Clean version updated to work with new ClientClass
 from ui.dialogs.edit_dialogs.base_dialog import BaseEditDialog
 from classes.client_class import ClientClass
 from PySide6.QtWidgets import QDialog, QMessageBox
-import re
+from ui.dialogs.edit_dialogs._validators import validate_email, validate_phone
 
 
 class ClientEditDialog(BaseEditDialog):
@@ -52,25 +52,16 @@ class ClientEditDialog(BaseEditDialog):
         # Set specific window title
         self.setWindowTitle(window_title)
     
-    def validate_data(self):
+    def validate_data(self, values=None):
         """Client-specific validation (extends base validation)"""
-        errors = super().validate_data()  # Get base validation errors
+        # Read widget values once and share them with the base validation
+        if values is None:
+            values = self._collect_form_values()
+        errors = super().validate_data(values)  # Get base validation errors
         
-        # Get current values from widgets
-        email = None
-        phone = None
-        name = None
-        username = None
-        
-        for param_key, widget in self.parameter_widgets.items():
-            if param_key == 'email':
-                email = self.get_widget_value(widget)
-            elif param_key == 'phone':
-                phone = self.get_widget_value(widget)
-            elif param_key == 'name':
-                name = self.get_widget_value(widget)
-            elif param_key == 'username':
-                username = self.get_widget_value(widget)
+        email = values.get('email')
+        phone = values.get('phone')
+        username = values.get('username')
         
         # Additional client-specific validation
         if email and not self._validate_email(email):
@@ -86,20 +77,12 @@ class ClientEditDialog(BaseEditDialog):
         return errors
     
     def _validate_email(self, email):
-        """Validate email format using regex"""
-        if not email:  # Email is optional
-            return True
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        """Validate email format"""
+        return validate_email(email)
     
     def _validate_phone(self, phone):
         """Validate phone format - allows numbers, spaces, hyphens, and parentheses"""
-        if not phone:  # Phone is optional
-            return True
-        # Remove common formatting characters
-        cleaned_phone = re.sub(r'[+\s\-()]', '', phone)
-        # Check if what remains are only digits and has reasonable length
-        return cleaned_phone.isdigit() and len(cleaned_phone) >= 7 and len(cleaned_phone) <= 15
+        return validate_phone(phone)
     
     def get_widget_value(self, widget):
         """Helper method to get value from widget"""
@@ -109,8 +92,9 @@ class ClientEditDialog(BaseEditDialog):
     def save_changes(self):
         """Save client changes without annoying success popup"""
         try:
-            # Validate data first
-            errors = self.validate_data()
+            # Validate data first (form values are read once and reused for saving)
+            values = self._collect_form_values()
+            errors = self.validate_data(values)
             
             # Separate warnings from critical errors
             critical_errors = [e for e in errors if not e.lower().startswith('warning')]
@@ -133,9 +117,7 @@ class ClientEditDialog(BaseEditDialog):
                     return
             
             # Update client object with form data
-            from ui.widgets.parameters_widgets import ParameterWidgetFactory
-            for param_key, widget in self.parameter_widgets.items():
-                value = ParameterWidgetFactory.get_widget_value(widget)
+            for param_key, value in values.items():
                 self.client.set_value(param_key, value)
             
             # Save to database
@@ -11,6 +11,26 @@ from PySide6.QtGui import QFont
 from datetime import datetime
 
 
+# Dark theme stylesheet
+_DARK_QSS = """
+    QDialog {
+        background-color: #2b2b2b;
+        color: #ffffff;
+    }
+    QLabel {
+        color: #ffffff;
+    }
+    QScrollArea {
+        background-color: #2b2b2b;
+        border: none;
+    }
+    QWidget {
+        background-color: #2b2b2b;
+        color: #ffffff;
+    }
+"""
+
+
 class ImportEditDialog(QDialog):
     """Import-specific edit dialog with inline import items editing"""
     
@@ -48,6 +68,8 @@ class ImportEditDialog(QDialog):
         self.data_object = self.import_obj
         self.ui_config = ui_config
         self.parameter_widgets = {}
+        # Resolved once - the parent's selected profile does not change while the dialog is open
+        self._profile_images_dir = self.get_profile_images_dir()
         
         # Set dialog properties
         self.setModal(True)
@@ -109,15 +131,12 @@ class ImportEditDialog(QDialog):
             # Check if parameter is editable
             editable = self.import_obj.is_parameter_editable(param_key, "dialog")
             
-            # Get profile images directory
-            profile_images_dir = self.get_profile_images_dir()
-            
             # Create appropriate widget
             from ui.widgets.parameters_widgets import ParameterWidgetFactory
             widget = ParameterWidgetFactory.create_widget(
                 param_info, 
                 self.ui_config.get(param_key, {}), 
-                profile_images_dir,
+                self._profile_images_dir,
                 editable
             )
             
@@ -137,7 +156,7 @@ class ImportEditDialog(QDialog):
             if param_info.get('required', False):
                 display_name += " *"
             
-            params_layout.addRow(QLabel(display_name + ":"), widget)
+            params_layout.addRow(display_name + ":", widget)
         
         layout.addWidget(params_widget)
         
@@ -213,37 +232,21 @@ class ImportEditDialog(QDialog):
     
     def apply_theme(self):
         """Apply dark theme styling"""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            QLabel {
-                color: #ffffff;
-            }
-            QScrollArea {
-                background-color: #2b2b2b;
-                border: none;
-            }
-            QWidget {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-        """)
+        self.setStyleSheet(_DARK_QSS)
     
     def get_profile_images_dir(self):
         """Get profile images directory if available"""
-        try:
-            if (hasattr(self.parent(), 'profile_manager') and 
-                self.parent().profile_manager and
-                self.parent().profile_manager.selected_profile):
-                
-                import os
-                profile_dir = os.path.dirname(self.parent().profile_manager.selected_profile.config_path)
-                return os.path.join(profile_dir, "images")
-        except:
-            pass
-        return None
+        profile_manager = getattr(self.parent(), 'profile_manager', None)
+        if not profile_manager or not profile_manager.selected_profile:
+            return None
+        
+        config_path = getattr(profile_manager.selected_profile, 'config_path', None)
+        if not config_path:
+            return None
+        
+        import os
+        profile_dir = os.path.dirname(config_path)
+        return os.path.join(profile_dir, "images")
     
     def add_total_fields(self, parent_layout):
         """Add read-only total calculation fields in horizontal layout"""
@@ -311,11 +314,8 @@ class ImportEditDialog(QDialog):
     def update_totals(self):
         """Update total calculation fields"""
         try:
-            # Get current items
-            items = self.import_items_table.get_items_data()
-            
-            # Calculate subtotal
-            subtotal = sum(item.get_value('subtotal') or 0 for item in items)
+            # Calculate subtotal straight from the table's subtotal column
+            subtotal = sum(self.import_items_table.get_subtotal_column())
             
             # Get VAT percentage from the tva parameter widget
             vat_percent = 0
@@ -48,34 +48,33 @@ class ProductEditDialog(BaseEditDialog):
         # Set specific window title
         self.setWindowTitle(window_title)
     
-    def validate_data(self):
+    def validate_data(self, values=None):
         """Product-specific validation (extends base validation)"""
-        errors = super().validate_data()  # Get base validation errors
+        # Read widget values once and share them with the base validation
+        if values is None:
+            values = self._collect_form_values()
+        errors = super().validate_data(values)  # Get base validation errors
         
-        # Get current values from widgets
-        unit_price = None
-        sale_price = None
-        username = None
+        unit_price = values.get('unit_price')
+        sale_price = values.get('sale_price')
+        username = values.get('username')
         
-        for param_key, widget in self.parameter_widgets.items():
-            if param_key == 'unit_price':
-                unit_price = self.get_widget_value(widget)
-            elif param_key == 'sale_price':
-                sale_price = self.get_widget_value(widget)
-            elif param_key == 'username':
-                username = self.get_widget_value(widget)
+        # Business rule: Both prices should be non-negative numbers (parsed once each)
+        prices = {}
+        for label, value in (("Unit price", unit_price), ("Sale price", sale_price)):
+            if value is None:
+                continue
+            price = self._parse_price(value)
+            if price is None:
+                continue  # Not a number: the base validation already reports "must be a valid number"
+            if price < 0:
+                errors.append(f"{label} cannot be negative")
+            else:
+                prices[label] = price
         
         # Additional product-specific validation
-        if unit_price is not None and sale_price is not None:
-            if sale_price < unit_price:
-                errors.append("Warning: Sale price is lower than unit price. This may result in losses.")
-        
-        # Business rule: Both prices should be non-negative
-        if unit_price is not None and unit_price < 0:
-            errors.append("Unit price cannot be negative")
-        
-        if sale_price is not None and sale_price < 0:
-            errors.append("Sale price cannot be negative")
+        if len(prices) == 2 and prices["Sale price"] < prices["Unit price"]:
+            errors.append("Warning: Sale price is lower than unit price. This may result in losses.")
         
         # Validate username uniqueness
         if username and not self.product.validate_username_uniqueness(username):
@@ -83,6 +82,13 @@ class ProductEditDialog(BaseEditDialog):
         
         return errors
     
+    def _parse_price(self, value):
+        """Return value as a float, or None if it is not a number"""
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+    
     def get_widget_value(self, widget):
         """Helper method to get value from widget"""
         from ui.widgets.parameters_widgets import ParameterWidgetFactory
@@ -91,8 +97,9 @@ class ProductEditDialog(BaseEditDialog):
     def save_changes(self):
         """Save product changes without annoying success popup"""
         try:
-            # Validate data first
-            errors = self.validate_data()
+            # Validate data first (form values are read once and reused for saving)
+            values = self._collect_form_values()
+            errors = self.validate_data(values)
             
             # Separate warnings from critical errors
             critical_errors = [e for e in errors if not e.lower().startswith('warning')]
@@ -115,10 +122,7 @@ class ProductEditDialog(BaseEditDialog):
                     return
             
             # Update product object with form data
-            from ui.widgets.parameters_widgets import ParameterWidgetFactory
-            for param_key, widget in self.parameter_widgets.items():
-                value = ParameterWidgetFactory.get_widget_value(widget)
-                self.product.set_value(param_key, value)
+            self.product.set_values(values)
             
             # Save to database
             success = self.product.save_to_database()
@@ -4,13 +4,30 @@ For managing sale transactions with items table
 """
 
 from classes.sales_class import SalesClass
-from classes.sales_item_class import SalesItemClass
-from ui.widgets.operations_table import OperationsTableWidget
-from PySide6.QtWidgets import QDialog, QMessageBox, QVBoxLayout, QHBoxLayout, QLabel, QWidget
+from ui.widgets.parameters_widgets import ParameterWidgetFactory
+from ui.widgets.themed_widgets import GreenButton, RedButton
+from PySide6.QtWidgets import QDialog, QDialogButtonBox, QMessageBox, QVBoxLayout, QHBoxLayout, QLabel, QFormLayout, QWidget
+from PySide6.QtCore import QSignalBlocker, QTimer
 from PySide6.QtGui import QFont
 from datetime import datetime
 
 
+# Dark theme stylesheet
+_DARK_QSS = """
+    QDialog {
+        background-color: #2b2b2b;
+        color: #ffffff;
+    }
+    QLabel {
+        color: #ffffff;
+    }
+    QWidget {
+        background-color: #2b2b2b;
+        color: #ffffff;
+    }
+"""
+
+
 class SaleEditDialog(QDialog):
     """Sale-specific edit dialog with inline sales items editing"""
     
@@ -48,6 +65,8 @@ class SaleEditDialog(QDialog):
         self.data_object = self.sale_obj
         self.ui_config = ui_config
         self.parameter_widgets = {}
+        # Resolved once - the parent's selected profile does not change while the dialog is open
+        self._profile_images_dir = self.get_profile_images_dir()
         
         # Set dialog properties
         self.setModal(True)
@@ -58,19 +77,73 @@ class SaleEditDialog(QDialog):
         else:
             self.setWindowTitle("New Sale")
         
-        # Setup our custom UI
-        self.setup_ui()
-    
-    def setup_ui(self):
-        """Setup dialog UI with simple, clean layout that ensures table scrolling works"""
-        from PySide6.QtWidgets import QFormLayout, QWidget
-        
         # Set reasonable default size but allow resizing
         self.resize(900, 700)
-        # Calculate proper minimum size to prevent overlay
-        # 120 (params) + 30 (label) + 200 (table min) + 60 (totals) + 50 (buttons) + 60 (margins/spacing + buffer)
-        self.setMinimumSize(600, 520)  # Added extra 15px buffer to prevent overlay
+        # Minimum height comes from the layout (sections keep their size hints, table min 200)
+        self.setMinimumWidth(600)
+        
+        # Widget tree (items table, totals, theme) is built on first show
+        self._built = False
+        # Items table is created one event-loop turn after the rest of the UI
+        self.sales_items_table = None
+        self._items_placeholder = None
+        
+        # Coalesce bursts of table/TVA changes into one totals recalculation per event-loop turn
+        self._totals_timer = QTimer(self)
+        self._totals_timer.setSingleShot(True)
+        self._totals_timer.setInterval(0)
+        self._totals_timer.timeout.connect(self._do_update_totals)
+        
+        # Client usernames loaded for the autocomplete (reused by _validate_client_exists)
+        self._known_client_usernames = set()
+        
+        # TVA percent, refreshed only when the TVA widget changes (None = not read yet)
+        self._vat_percent = None
+    
+    def showEvent(self, event):
+        """Build the UI lazily the first time the dialog becomes visible"""
+        self.ensure_ui_built()
+        super().showEvent(event)
+    
+    def ensure_ui_built(self):
+        """Build the dialog UI once (safe to call before showing the dialog)"""
+        if not self._built:
+            self._built = True
+            self.setup_ui()
+    
+    def ensure_items_table(self):
+        """Create the sales items table once, swapping it in for its placeholder"""
+        if self.sales_items_table is not None:
+            return
+        
+        # Imported here so importing this module does not pull in the table stack
+        from classes.sales_item_class import SalesItemClass
+        from ui.widgets.operations_table import OperationsTableWidget
         
+        # Create sales items table (this will have internal scrolling)
+        self.sales_items_table = OperationsTableWidget(
+            item_class=SalesItemClass,
+            parent_operation=self.sale_obj,
+            database=self.database,
+            columns=['product_preview', 'product_name', 'quantity', 'unit_price', 'subtotal', 'delete_action'],
+            parent=self,
+            highlight_stock_exceed=True
+        )
+        
+        # Connect table changes to update totals
+        self.sales_items_table.items_changed.connect(self.update_totals)
+        
+        # Give the table most of the remaining space (stretches with dialog)
+        self.sales_items_table.setMinimumHeight(200)  # Reduced minimum for better resizing
+        if self._items_placeholder is not None:
+            self.layout().replaceWidget(self._items_placeholder, self.sales_items_table)
+            self._items_placeholder.deleteLater()
+            self._items_placeholder = None
+        
+        self.update_totals()
+    
+    def setup_ui(self):
+        """Setup dialog UI with simple, clean layout that ensures table scrolling works"""
         layout = QVBoxLayout(self)
         layout.setContentsMargins(15, 15, 15, 15)
         layout.setSpacing(10)
@@ -85,39 +158,27 @@ class SaleEditDialog(QDialog):
             id_layout.addStretch()
             layout.addLayout(id_layout)
         
-        # Sale parameters section (compact, fixed height)
-        params_widget = QWidget()
-        params_widget.setFixedHeight(120)  # Fixed height for parameters
-        params_layout = QFormLayout(params_widget)
+        # Sale parameters section (compact, added directly - no wrapper widget)
+        params_layout = QFormLayout()
         params_layout.setContentsMargins(5, 5, 5, 5)
         params_layout.setSpacing(8)
         
-        # Get parameters that should be shown in dialog
-        visible_params = self.sale_obj.get_visible_parameters("dialog")
-        
-        # Create widgets for each visible parameter
-        for param_key in visible_params:
-            if param_key not in self.sale_obj.parameters:
-                continue
-            
+        # Create widgets for each visible, non-calculated parameter (spec is cached per class)
+        for param_key, editable, required in self.sale_obj.get_dialog_param_spec():
             param_info = self.sale_obj.parameters[param_key]
             
-            # Skip calculated parameters
-            if self.sale_obj.is_parameter_calculated(param_key):
-                continue
-            
-            # Check if parameter is editable
-            editable = self.sale_obj.is_parameter_editable(param_key, "dialog")
-            
-            # Get profile images directory
-            profile_images_dir = self.get_profile_images_dir()
+            # Fetch client usernames once: the autocomplete gets a static list instead of
+            # re-querying on every keystroke, and validation reuses it as a set
+            if param_key == 'client_username':
+                client_usernames = self.sale_obj.get_client_username_options()
+                self._known_client_usernames = set(client_usernames)
+                param_info = dict(param_info, options=client_usernames)
             
             # Create appropriate widget
-            from ui.widgets.parameters_widgets import ParameterWidgetFactory
             widget = ParameterWidgetFactory.create_widget(
                 param_info, 
                 self.ui_config.get(param_key, {}), 
-                profile_images_dir,
+                self._profile_images_dir,
                 editable
             )
             
@@ -126,22 +187,21 @@ class SaleEditDialog(QDialog):
             # Connect TVA widget to update totals when value changes
             if param_key == 'tva':
                 # Support both legacy numeric and new checkbox widget.
-                # Use lambda to ignore the emitted value/state argument so our slot signature matches.
                 if hasattr(widget, 'spinbox'):
-                    widget.spinbox.valueChanged.connect(lambda _val: self.update_totals())
+                    widget.spinbox.valueChanged.connect(self._on_tva_changed)
                 if hasattr(widget, 'checkbox'):
-                    widget.checkbox.stateChanged.connect(lambda _state: self.update_totals())
+                    widget.checkbox.stateChanged.connect(self._on_tva_changed)
             
             # Get display name
             display_name = self.sale_obj.get_display_name(param_key)
             
             # Add required indicator
-            if param_info.get('required', False):
+            if required:
                 display_name += " *"
             
-            params_layout.addRow(QLabel(display_name + ":"), widget)
+            params_layout.addRow(display_name + ":", widget)
         
-        layout.addWidget(params_widget)
+        layout.addLayout(params_layout)
         
         # Sales Items label
         items_label = QLabel("Sales Items")
@@ -149,108 +209,58 @@ class SaleEditDialog(QDialog):
         items_label.setStyleSheet("color: #ffffff; margin: 5px 0;")
         layout.addWidget(items_label)
         
-        # Create sales items table (this will have internal scrolling)
-        self.sales_items_table = OperationsTableWidget(
-            item_class=SalesItemClass,
-            parent_operation=self.sale_obj,
-            database=self.database,
-            columns=['product_preview', 'product_name', 'quantity', 'unit_price', 'subtotal', 'delete_action'],
-            parent=self,
-            highlight_stock_exceed=True
-        )
+        # Reserve the table's space with an empty placeholder so the dialog paints first;
+        # the real sales items table (item loading, stock lookups) is built on the next turn
+        self._items_placeholder = QWidget()
+        self._items_placeholder.setMinimumHeight(200)
+        layout.addWidget(self._items_placeholder, 1)  # Stretch factor 1 = takes extra space
+        QTimer.singleShot(0, self.ensure_items_table)
         
-        # Connect table changes to update totals
-        self.sales_items_table.items_changed.connect(self.update_totals)
-        
-        # Give the table most of the remaining space (stretches with dialog)
-        self.sales_items_table.setMinimumHeight(200)  # Reduced minimum for better resizing
-        layout.addWidget(self.sales_items_table, 1)  # Stretch factor 1 = takes extra space
-        
-        # Totals section (compact, fixed height) - ALWAYS AFTER TABLE
-        totals_widget = QWidget()
-        totals_widget.setFixedHeight(60)  # Fixed height for totals
-        totals_layout = QHBoxLayout(totals_widget)
+        # Totals section (compact, no stretch) - ALWAYS AFTER TABLE
+        totals_layout = QHBoxLayout()
         totals_layout.setContentsMargins(5, 5, 5, 5)
         
         # Add total fields
         self.add_total_fields(totals_layout)
         
-        layout.addWidget(totals_widget)
+        layout.addLayout(totals_layout, 0)
         
-        # Button section (fixed height)
-        button_widget = QWidget()
-        button_widget.setFixedHeight(50)
-        button_layout = QHBoxLayout(button_widget)
-        button_layout.addStretch()
+        # Button section (no stretch) - themed buttons placed by a native button box
+        button_box = QDialogButtonBox()
         
-        from ui.widgets.themed_widgets import GreenButton, RedButton
         self.save_btn = GreenButton("Save")
-        self.save_btn.clicked.connect(self.save_changes)
-        button_layout.addWidget(self.save_btn)
+        button_box.addButton(self.save_btn, QDialogButtonBox.AcceptRole)
         
         self.cancel_btn = RedButton("Cancel")
-        self.cancel_btn.clicked.connect(self.reject)
-        button_layout.addWidget(self.cancel_btn)
+        button_box.addButton(self.cancel_btn, QDialogButtonBox.RejectRole)
         
-        layout.addWidget(button_widget)
+        button_box.accepted.connect(self.save_changes)
+        button_box.rejected.connect(self.reject)
+        layout.addWidget(button_box, 0)
         
         # Apply dark theme
         self.apply_theme()
     
-    def minimumSizeHint(self):
-        """Calculate minimum size to prevent component overlay"""
-        from PySide6.QtCore import QSize
-        
-        # Calculate minimum height needed for all components
-        min_height = (
-            120 +  # params section (fixed)
-            30 +   # sales items label 
-            200 +  # table minimum height
-            60 +   # totals section (fixed)
-            50 +   # button section (fixed)
-            60     # margins and spacing + buffer
-        )
-        
-        return QSize(600, min_height)
-    
     def apply_theme(self):
         """Apply dark theme styling"""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            QLabel {
-                color: #ffffff;
-            }
-            QScrollArea {
-                background-color: #2b2b2b;
-                border: none;
-            }
-            QWidget {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-        """)
+        self.setStyleSheet(_DARK_QSS)
     
     def get_profile_images_dir(self):
         """Get profile images directory if available"""
-        try:
-            if (hasattr(self.parent(), 'profile_manager') and 
-                self.parent().profile_manager and
-                self.parent().profile_manager.selected_profile):
-                
-                import os
-                profile_dir = os.path.dirname(self.parent().profile_manager.selected_profile.config_path)
-                return os.path.join(profile_dir, "images")
-        except:
-            pass
-        return None
+        profile_manager = getattr(self.parent(), 'profile_manager', None)
+        if not profile_manager or not profile_manager.selected_profile:
+            return None
+        
+        config_path = getattr(profile_manager.selected_profile, 'config_path', None)
+        if not config_path:
+            return None
+        
+        import os
+        profile_dir = os.path.dirname(config_path)
+        return os.path.join(profile_dir, "images")
     
     def add_total_fields(self, parent_layout):
         """Add read-only total calculation fields in horizontal layout"""
-        from ui.widgets.parameters_widgets import ParameterWidgetFactory
-        
         # Subtotal
         subtotal_widget = ParameterWidgetFactory.create_widget(
             {
@@ -307,99 +317,128 @@ class SaleEditDialog(QDialog):
     
     def get_widget_value(self, widget):
         """Helper method to get value from widget"""
-        from ui.widgets.parameters_widgets import ParameterWidgetFactory
         return ParameterWidgetFactory.get_widget_value(widget)
     
     def update_totals(self):
+        """Schedule a totals recalculation (coalesced until control returns to the event loop)"""
+        self._totals_timer.start()
+    
+    def _on_tva_changed(self, _value=None):
+        """Re-read the cached TVA percent and refresh totals"""
+        self._vat_percent = self._read_vat_percent()
+        self.update_totals()
+    
+    def _read_vat_percent(self):
+        """Get VAT percentage from the tva parameter widget"""
+        if 'tva' not in self.parameter_widgets:
+            return 0.0
+        try:
+            return float(ParameterWidgetFactory.get_widget_value(self.parameter_widgets['tva']) or 0)
+        except (TypeError, ValueError):
+            return 0.0
+    
+    def _do_update_totals(self):
         """Update total calculation fields"""
+        if self.sales_items_table is None:
+            return  # Table not built yet - ensure_items_table() recalculates once it is
+        
         try:
-            # Get current items
-            items = self.sales_items_table.get_items_data()
-            
-            # Calculate subtotal
-            subtotal = sum(item.get_value('subtotal') or 0 for item in items)
+            # Re-sum the shown row subtotals (plain floats, once per coalesced update)
+            subtotal = sum(self.sales_items_table.get_subtotal_column())
             
-            # Get VAT percentage from the tva parameter widget
-            vat_percent = 0
-            if 'tva' in self.parameter_widgets:
-                try:
-                    vat_percent = float(self.get_widget_value(self.parameter_widgets['tva']) or 0)
-                except Exception:
-                    vat_percent = 0
+            # VAT percentage is cached and only re-read when the TVA widget changes
+            if self._vat_percent is None:
+                self._vat_percent = self._read_vat_percent()
             
             # Calculate VAT amount
-            vat_amount = subtotal * (vat_percent / 100)
+            vat_amount = subtotal * (self._vat_percent / 100)
             
             # Calculate total
             total = subtotal + vat_amount
             
-            # Update widgets
-            from ui.widgets.parameters_widgets import ParameterWidgetFactory
-            if hasattr(self, 'subtotal_widget'):
-                ParameterWidgetFactory.set_widget_value(self.subtotal_widget, subtotal)
-            if hasattr(self, 'vat_widget'):
-                ParameterWidgetFactory.set_widget_value(self.vat_widget, vat_amount)
-            if hasattr(self, 'total_widget'):
-                ParameterWidgetFactory.set_widget_value(self.total_widget, total)
+            # Update widgets (signals blocked - these are programmatic, read-only updates)
+            for attr_name, value in (('subtotal_widget', subtotal), ('vat_widget', vat_amount), ('total_widget', total)):
+                widget = getattr(self, attr_name, None)
+                if widget is None:
+                    continue
+                with QSignalBlocker(getattr(widget, 'spinbox', widget)):
+                    ParameterWidgetFactory.set_widget_value(widget, value)
                 
         except Exception as e:
             print(f"Error updating totals: {e}")
     
 
-    def validate_data(self):
-        """Sale-specific validation"""
+    def validate_data(self, values=None):
+        """Sale-specific validation (values: form values from _collect_form_values)"""
         errors = []
         
+        # Read widget values once (save_changes passes in the values it will save)
+        if values is None:
+            values = self._collect_form_values()
+        
         # Basic parameter validation
-        for param_key, widget in self.parameter_widgets.items():
+        for param_key, value in values.items():
             param_info = self.sale_obj.parameters.get(param_key, {})
             
             # Check if required parameter is empty
             if param_info.get('required', False):
-                value = self.get_widget_value(widget)
                 if not value or (isinstance(value, str) and not value.strip()):
                     display_name = self.sale_obj.get_display_name(param_key)
                     errors.append(f"{display_name} is required")
         
         # Additional sale-specific validation
-        client_username = self.get_widget_value(self.parameter_widgets.get('client_username', ''))
+        client_username = values.get('client_username')
         
         # Validate client username exists
         if client_username and not self._validate_client_exists(client_username):
             errors.append(f"Client username '{client_username}' does not exist")
         
         # Check if we have at least one item
+        self.ensure_items_table()
         items = self.sales_items_table.get_items_data()
         if not items:
             errors.append("Please add at least one item to the sale")
         
         return errors
     
+    def _collect_form_values(self):
+        """Read every parameter widget once into a {param_key: value} dict"""
+        get_widget_value = ParameterWidgetFactory.get_widget_value
+        return {param_key: get_widget_value(widget) for param_key, widget in self.parameter_widgets.items()}
+    
     def _validate_client_exists(self, username):
         """Check if client username exists in database"""
+        if username in self._known_client_usernames:
+            return True
+        
+        # Not in the list fetched when the dialog opened - the client may have been
+        # created since, so ask the database before rejecting it
         if not self.database or not hasattr(self.database, 'cursor') or not self.database.cursor:
             return False
         
         try:
             self.database.cursor.execute("SELECT COUNT(*) FROM Clients WHERE username = ?", (username,))
             result = self.database.cursor.fetchone()
-            return result[0] > 0 if result else False
+            if result and result[0] > 0:
+                self._known_client_usernames.add(username)
+                return True
+            return False
         except Exception as e:
-            print(f"Error validating client: {e}")
+            print(f"Error validating client {username!r}: {e}")
             return False
     
     def save_changes(self):
         """Save sale changes to database using simple approach"""
-        # Validate data first
-        errors = self.validate_data()
+        # Validate data first (form values are read once and reused for saving)
+        values = self._collect_form_values()
+        errors = self.validate_data(values)
         if errors:
             QMessageBox.warning(self, "Validation Error", "\n".join(errors))
             return
         
         try:
             # Update sale object with form data
-            for param_key, widget in self.parameter_widgets.items():
-                value = self.get_widget_value(widget)
+            for param_key, value in values.items():
                 self.sale_obj.set_value(param_key, value)
             
             # Save sale to database first
@@ -418,21 +457,17 @@ class SaleEditDialog(QDialog):
                 # Simple approach: Clear all existing items and add current ones
                 operation_id = self.sale_obj.id
                 
-                # Delete all existing sales items for this operation
-                if hasattr(self.sale_obj, 'get_sales_items'):
-                    existing_items = self.sale_obj.get_sales_items()
-                    for item in existing_items:
-                        if hasattr(item, 'id') and item.id:
-                            self.database.delete_item(item.id, "Sales_Items")
-                
-                # Add all current table items
+                # Replace all sales items for this operation with the current table rows
+                # (one DELETE + one executemany in a single transaction)
                 current_data = self.sales_items_table.get_current_table_data()
-                items_saved = 0
-                
                 for item_data in current_data:
                     item_data['sales_id'] = operation_id
-                    if self.database.add_item(item_data, "Sales_Items"):
-                        items_saved += 1
+                
+                items_saved = self.database.replace_items_by_operation_id(operation_id, current_data, "Sales_Items")
+                if items_saved is None:
+                    # The transaction was rolled back: keep the dialog open so the user can retry
+                    QMessageBox.critical(self, "Error", "Failed to save sale items")
+                    return
                 
                 QMessageBox.information(self, "Success", 
                     f"Sale {action} successfully!\n{items_saved} items saved.")
@@ -5,7 +5,7 @@ Supplier Dialog - Clean version updated to work with new SupplierClass
 from ui.dialogs.edit_dialogs.base_dialog import BaseEditDialog
 from classes.supplier_class import SupplierClass
 from PySide6.QtWidgets import QDialog, QMessageBox
-import re
+from ui.dialogs.edit_dialogs._validators import validate_email, validate_phone
 
 
 class SupplierEditDialog(BaseEditDialog):
@@ -46,31 +46,48 @@ class SupplierEditDialog(BaseEditDialog):
             }
         }
         
+        # The form is built on first show (ensure_ui_built), not by the base constructor
+        self._built = False
+        
         # Initialize base dialog
         super().__init__(self.supplier, ui_config, parent)
         
         # Set specific window title
         self.setWindowTitle(window_title)
     
-    def validate_data(self):
+    def setup_ui(self):
+        """Defer building the form until the dialog is first shown (see ensure_ui_built)"""
+        pass
+    
+    def load_data(self):
+        """Load supplier data into the form (only once it has been built)"""
+        if self._built:
+            super().load_data()
+    
+    def showEvent(self, event):
+        """Build the form lazily the first time the dialog becomes visible"""
+        self.ensure_ui_built()
+        super().showEvent(event)
+    
+    def ensure_ui_built(self):
+        """Build and fill the form once (safe to call before showing the dialog)"""
+        if not self._built:
+            self._built = True
+            super().setup_ui()
+            super().load_data()
+    
+    def validate_data(self, values=None):
         """Supplier-specific validation (extends base validation)"""
-        errors = super().validate_data()  # Get base validation errors
+        self.ensure_ui_built()
+        # Read widget values once and share them with the base validation
+        if values is None:
+            values = self._collect_form_values()
+        errors = super().validate_data(values)  # Get base validation errors
         
-        # Get current values from widgets
-        email = None
-        phone = None
-        name = None
-        username = None
-        
-        for param_key, widget in self.parameter_widgets.items():
-            if param_key == 'email':
-                email = self.get_widget_value(widget)
-            elif param_key == 'phone':
-                phone = self.get_widget_value(widget)
-            elif param_key == 'name':
-                name = self.get_widget_value(widget)
-            elif param_key == 'username':
-                username = self.get_widget_value(widget)
+        email = values.get('email')
+        phone = values.get('phone')
+        name = values.get('name')
+        username = values.get('username')
         
         # Additional supplier-specific validation
         if email and not self._validate_email(email):
@@ -90,20 +107,17 @@ class SupplierEditDialog(BaseEditDialog):
         return errors
     
     def _validate_email(self, email):
-        """Validate email format using regex"""
-        if not email:  # Email is optional
-            return True
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        """Validate email format"""
+        return validate_email(email)
     
     def _validate_phone(self, phone):
         """Validate phone format - allows numbers, spaces, hyphens, and parentheses"""
-        if not phone:  # Phone is optional
-            return True
-        # Remove common formatting characters
-        cleaned_phone = re.sub(r'[+\s\-()]', '', phone)
-        # Check if what remains are only digits and has reasonable length
-        return cleaned_phone.isdigit() and len(cleaned_phone) >= 7 and len(cleaned_phone) <= 15
+        return validate_phone(phone)
+    
+    def _collect_form_values(self):
+        """Read every parameter widget once into a {param_key: value} dict"""
+        self.ensure_ui_built()
+        return super()._collect_form_values()
     
     def get_widget_value(self, widget):
         """Helper method to get value from widget"""
@@ -113,8 +127,9 @@ class SupplierEditDialog(BaseEditDialog):
     def save_changes(self):
         """Save supplier changes without annoying success popup"""
         try:
-            # Validate data first
-            errors = self.validate_data()
+            # Validate data first (form values are read once and reused for saving)
+            values = self._collect_form_values()
+            errors = self.validate_data(values)
             
             # Separate warnings from critical errors
             critical_errors = [e for e in errors if not e.lower().startswith('warning')]
@@ -137,10 +152,7 @@ class SupplierEditDialog(BaseEditDialog):
                     return
             
             # Update supplier object with form data
-            from ui.widgets.parameters_widgets import ParameterWidgetFactory
-            for param_key, widget in self.parameter_widgets.items():
-                value = ParameterWidgetFactory.get_widget_value(widget)
-                self.supplier.set_value(param_key, value)
+            self.supplier.set_values(values)
             
             # Save to database
             success = self.supplier.save_to_database()
@@ -160,7 +172,7 @@ class SupplierEditDialog(BaseEditDialog):
 
 
 # Helper function to easily create supplier dialogs
-def show_supplier_dialog(supplier_id=None, database=None, parent=None):
+def show_supplier_dialog(supplier_id=None, database=None, parent=None, on_done=None):
     """
     Convenience function to show supplier dialog
     
@@ -168,13 +180,28 @@ def show_supplier_dialog(supplier_id=None, database=None, parent=None):
         supplier_id: ID of existing supplier (None for new supplier)
         database: Database instance
         parent: Parent widget
+        on_done: Optional callback(success, supplier_object). When given, the dialog is
+                 opened window-modal with open() (no nested event loop) and the callback
+                 runs when it closes.
         
     Returns:
-        tuple: (success: bool, supplier_object: SupplierClass or None)
+        tuple: (success: bool, supplier_object: SupplierClass or None) without on_done,
+        otherwise the open SupplierEditDialog
     """
     dialog = SupplierEditDialog(supplier_id, database, parent)
     
+    if on_done is not None:
+        def finished(result):
+            if result == QDialog.Accepted:
+                on_done(True, dialog.get_supplier_data())
+            else:
+                on_done(False, None)
+        
+        dialog.finished.connect(finished)
+        dialog.open()
+        return dialog
+    
     if dialog.exec() == QDialog.Accepted:
         return True, dialog.get_supplier_data()
     else:
-        return False, None
\ No newline at end of file
+        return False, None
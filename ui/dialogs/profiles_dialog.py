@@ -2,16 +2,139 @@
 Profile management dialog - create, delete, and switch between user profiles
 """
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QLabel, QFileDialog, QScrollArea,
-                               QSplitter, QWidget, QHBoxLayout, QLineEdit, QPushButton, QMessageBox, QTextEdit)
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPixmap
+                               QSplitter, QWidget, QHBoxLayout, QLineEdit, QPushButton, QMessageBox, QTextEdit,
+                               QFormLayout)
+from PySide6.QtCore import Qt, QBuffer, QEvent, QByteArray, QObject, QRunnable, QThreadPool, QSignalBlocker, Signal
+from PySide6.QtGui import QPixmap, QPixmapCache, QImage, QImageReader, QPainter, QPalette, QPen, QColor
 import os
+import sys
 import time
 import shutil
+import filecmp
+import tempfile
+from functools import lru_cache
 
 from ui.widgets.themed_widgets import RedButton, GreenButton, BlueButton, PasswordInputWidget
 from ui.widgets.cards_list import GridCardsList
+from ui.widgets.preview_widget import scale_for_preview
 from core.profiles import ProfileClass, ProfileManager
+from core.password import PasswordManager
+from ui.theme import dark_palette
+
+
+_HOME = os.path.expanduser("~")  # Fallback start folder for the profiles browser
+
+
+_FICLONE = 0x40049409  # Linux ioctl: share a file's extents (btrfs, xfs, ...)
+
+
+def _clone_file(source_path, dest_path):
+    """Reflink source_path to dest_path; returns False if the platform or filesystem can't.
+    A reflink is copy-on-write, so later writes to either file never affect the other.
+    The clone is made in a temp file first, so a failed clone leaves dest_path untouched."""
+    if not sys.platform.startswith('linux'):
+        return False
+    try:
+        import fcntl
+    except ImportError:
+        return False
+    
+    try:
+        temp_fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(dest_path) or ".")
+    except OSError:
+        return False
+    try:
+        with os.fdopen(temp_fd, 'wb') as dst, open(source_path, 'rb') as src:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        try:
+            shutil.copystat(source_path, temp_path)
+        except OSError:
+            pass  # Timestamps/permissions are cosmetic for a preview image
+        os.replace(temp_path, dest_path)
+        return True
+    except OSError:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        return False
+
+
+@lru_cache(maxsize=32)
+def _load_scaled_image(image_path, mtime, width, height, from_memory=False):
+    """Load an image scaled to fit width x height (cached per path, mtime and size).
+    from_memory reads the bytes first so the file is never held open by Qt.
+    Only uses QImage, so it is safe to call from a worker thread."""
+    if from_memory:
+        # Load image from file data instead of file path to avoid locking
+        with open(image_path, 'rb') as f:
+            image_data = f.read()
+        buffer = QBuffer()
+        buffer.setData(QByteArray(image_data))
+        reader = QImageReader(buffer)
+    else:
+        reader = QImageReader(image_path)
+    
+    # Decode straight to the preview size (JPEG can skip most of the full-size decode)
+    reader.setAutoTransform(True)
+    source_size = reader.size()
+    if source_size.isValid():
+        reader.setScaledSize(source_size.scaled(width, height, Qt.KeepAspectRatio))
+    
+    image = reader.read()
+    if not image.isNull() and not source_size.isValid():
+        image = scale_for_preview(image, width, height)
+    return image
+
+
+class _ImageLoadSignals(QObject):
+    """Carries finished preview loads from the thread pool back to the GUI thread"""
+    loaded = Signal(str, QImage, str)  # image_path, scaled image (null on failure), error message
+
+
+class _ScaleImageTask(QRunnable):
+    """Decode and scale a preview image off the GUI thread"""
+    
+    def __init__(self, image_path, width, height, signals, from_memory=False):
+        super().__init__()
+        self.image_path = image_path
+        self.width = width
+        self.height = height
+        self.signals = signals
+        self.from_memory = from_memory
+    
+    def run(self):
+        try:
+            image = _load_scaled_image(self.image_path, os.path.getmtime(self.image_path),
+                                       self.width, self.height, self.from_memory)
+            self.signals.loaded.emit(self.image_path, image, "")
+        except Exception as e:
+            self.signals.loaded.emit(self.image_path, QImage(), str(e))
+
+
+class _ImageDropLabel(QLabel):
+    """Image preview label with a dashed border, drawn directly instead of through QSS"""
+    
+    _BORDER_PEN = QPen(QColor("#555555"), 2, Qt.DashLine)
+    
+    def __init__(self, text="", parent=None):
+        super().__init__(text, parent)
+        palette = self.palette()
+        palette.setColor(QPalette.Window, QColor("#404040"))
+        self.setPalette(palette)
+        # paintEvent fills every pixel itself, so Qt can skip painting what is behind the label
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(event.rect(), self.palette().color(QPalette.Window))
+        painter.end()
+        super().paintEvent(event)
+        painter = QPainter(self)
+        painter.setPen(self._BORDER_PEN)
+        painter.drawRect(self.rect().adjusted(1, 1, -2, -2))
+        painter.end()
+
 
 class ProfilesDialog(QDialog):
     def __init__(self, parent=None):
@@ -22,6 +145,7 @@ class ProfilesDialog(QDialog):
         self.load_config(parent)
         
         self.right_enabled = False
+        self._right_panel_edit_mode = None  # Border style currently applied to the right panel
         self.is_editing_existing = False
         self.edit_mode = None  # None, 'new', 'edit', 'duplicate'
         self.source_profile_name = None  # Track source profile for duplication
@@ -29,8 +153,13 @@ class ProfilesDialog(QDialog):
         # Initialize right panel components
         self.image_path = ""
         self.original_image_path = ""  # Track original image to detect changes
-        self.right_components = []  # Store all editable components
-        self.parameter_edits = {}  # Store parameter line edits by key
+        self._dir_dialog = None  # File dialogs are created on first use and then reused
+        self._image_dialog = None
+        self._image_loader = _ImageLoadSignals(self)  # Background preview loads report back here
+        self._image_loader.loaded.connect(self._on_preview_image_loaded)
+        self._pending_preview_key = None  # Pixmap cache key of the preview being loaded
+        self._password_manager = None  # Created by get_password_manager()
+        self._duplicate_profile = None  # Display copy reused by every on_card_duplicate()
         
         # Use parent's profile manager or create new one
         if hasattr(parent, 'profile_manager'):
@@ -40,36 +169,18 @@ class ProfilesDialog(QDialog):
         
         self.profile_manager.profiles_path = self.profiles_path
         self.empty_profile = self.profile_manager.empty_profile
+        # Parameter defaults are fixed, so resolve them once for refresh_info
+        self._param_defaults = {
+            param_key: self.empty_profile.get_parameter_info(param_key, "default") or ""
+            for param_key in self.empty_profile.available_parameters["dialog"]
+        }
         self.current_profile = None
         
         # Store references to header and footer buttons for disabling
         self.header_footer_components = []
         
-        # Apply dark theme
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            QScrollArea {
-                background-color: #2b2b2b;
-                border: none;
-            }
-            QLabel {
-                color: #ffffff;
-            }
-            QLineEdit {
-                background-color: #404040;
-                border: 1px solid #555555;
-                padding: 5px;
-                color: #ffffff;
-            }
-            QLineEdit:disabled {
-                background-color: #2a2a2a;
-                border: 1px solid #333333;
-                color: #666666;
-            }
-        """)
+        # Dark theme: window colours from the shared palette, widget rules from the app stylesheet (ui/theme.py)
+        self.setPalette(dark_palette())
         
         # Main vertical layout
         layout = QVBoxLayout()
@@ -77,7 +188,7 @@ class ProfilesDialog(QDialog):
         # Header row with label, stretch, line edit, and browse button
         header_layout = QHBoxLayout()
         header_label = QLabel("Profiles Dialog")
-        header_label.setStyleSheet("color: #ffffff; font-size: 18px; font-weight: bold;")
+        header_label.setObjectName("profiles_header")  # Styled by the app-wide sheet (ui/theme.py)
         header_layout.addWidget(header_label)
 
         header_layout.addStretch()
@@ -89,9 +200,7 @@ class ProfilesDialog(QDialog):
         self.profiles_path_edit.setText(self.profiles_path)
         header_layout.addWidget(self.profiles_path_edit)
 
-        self.browse_btn = BlueButton("Browse")
-        self.browse_btn.setFixedSize(100, 30)
-        self.browse_btn.clicked.connect(self.browse_profiles_path)
+        self.browse_btn = self._make_button(BlueButton, "Browse", (100, 30), self.browse_profiles_path)
         header_layout.addWidget(self.browse_btn)
         
         # Store browse button for disabling
@@ -105,8 +214,16 @@ class ProfilesDialog(QDialog):
         # Create left and right widgets and set their layouts
         self.left_widget = QWidget()
         self.right_widget = QWidget()
+        self.right_widget.setObjectName("right_panel")
+        self.right_widget.setAttribute(Qt.WA_StyledBackground, True)  # Draw the QSS border on a plain QWidget
         self.left_widget.setLayout(self.create_left_layout())
-        self.right_widget.setLayout(self.create_right_layout())
+        # The editable right panel is built on first use; until then it only shows a hint
+        self._right_built = False
+        self._right_host_layout = QVBoxLayout(self.right_widget)
+        self._right_host_layout.setContentsMargins(0, 0, 0, 0)
+        self._right_placeholder = QLabel("Select a profile to see its details")
+        self._right_placeholder.setAlignment(Qt.AlignCenter)
+        self._right_host_layout.addWidget(self._right_placeholder)
 
         # Store splitter reference for resize handling
         self.splitter = splitter
@@ -124,12 +241,8 @@ class ProfilesDialog(QDialog):
 
         # Confirm and Cancel buttons centered
         button_layout = QHBoxLayout()
-        self.confirm_btn = GreenButton("Confirm")
-        self.confirm_btn.clicked.connect(self.confirm)
-        self.confirm_btn.setFixedSize(150, 30)
-        self.cancel_btn = RedButton("Cancel")
-        self.cancel_btn.clicked.connect(self.cancel)
-        self.cancel_btn.setFixedSize(150, 30)
+        self.confirm_btn = self._make_button(GreenButton, "Confirm", (150, 30), self.confirm)
+        self.cancel_btn = self._make_button(RedButton, "Cancel", (150, 30), self.cancel)
         button_layout.addStretch()
         button_layout.addWidget(self.confirm_btn)
         button_layout.addWidget(self.cancel_btn)
@@ -138,6 +251,11 @@ class ProfilesDialog(QDialog):
         
         # Store footer buttons for disabling
         self.header_footer_components.extend([self.confirm_btn, self.cancel_btn])
+        # Resolve each component's enable setter once: themed buttons restyle via set_enable
+        self._header_footer_setters = [
+            component.set_enable if hasattr(component, 'set_enable') else component.setEnabled
+            for component in self.header_footer_components
+        ]
         
         self.setLayout(layout)
         
@@ -159,15 +277,18 @@ class ProfilesDialog(QDialog):
             # Update the right panel with the selected profile
             self.refresh_info(self.profile_manager.selected_profile)
         
+    def _make_button(self, button_class, text, size, slot):
+        """Create a fixed-size themed button wired to slot"""
+        button = button_class(text)
+        button.setFixedSize(*size)
+        button.clicked.connect(slot)
+        return button
+    
     def create_overlay(self):
         """Create semi-transparent overlay for left panel"""
         self.overlay = QWidget(self.left_widget)
-        self.overlay.setStyleSheet("""
-            QWidget {
-                background-color: rgba(0, 0, 0, 120);
-                border-radius: 5px;
-            }
-        """)
+        self.overlay.setObjectName("profiles_overlay")  # Styled by the app-wide sheet (ui/theme.py)
+        self.overlay.setAttribute(Qt.WA_StyledBackground)
         # Position overlay to cover entire left widget
         self.overlay.setGeometry(0, 0, self.left_widget.width(), self.left_widget.height())
         self.overlay.hide()
@@ -185,6 +306,15 @@ class ProfilesDialog(QDialog):
         super().showEvent(event)
         self.update_overlay_size()
         
+    def eventFilter(self, obj, event):
+        """Open the image picker when the preview is clicked in edit mode"""
+        if (self._right_built and obj is self.image_label
+                and event.type() == QEvent.MouseButtonPress):
+            if self.right_enabled:
+                self.select_image(event)
+            return True
+        return super().eventFilter(obj, event)
+    
     def resizeEvent(self, event):
         """Update overlay size when dialog is resized"""
         super().resizeEvent(event)
@@ -207,13 +337,8 @@ class ProfilesDialog(QDialog):
         header_layout = QHBoxLayout()
         header_layout.addStretch()
         
-        self.save_btn = GreenButton("Save")
-        self.save_btn.setFixedSize(80, 30)
-        self.save_btn.clicked.connect(self.save_profile)
-        
-        self.cancel_edit_btn = RedButton("Cancel")
-        self.cancel_edit_btn.setFixedSize(80, 30)
-        self.cancel_edit_btn.clicked.connect(self.cancel_edit)
+        self.save_btn = self._make_button(GreenButton, "Save", (80, 30), self.save_profile)
+        self.cancel_edit_btn = self._make_button(RedButton, "Cancel", (80, 30), self.cancel_edit)
         
         header_layout.addWidget(self.save_btn)
         header_layout.addWidget(self.cancel_edit_btn)
@@ -226,46 +351,50 @@ class ProfilesDialog(QDialog):
         self.scroll_layout = QVBoxLayout()
         
         # Image preview
-        self.image_label = QLabel("Click to select image")
+        self.image_label = _ImageDropLabel("Click to select image")
         self.image_label.setFixedHeight(150)
         self.image_label.setAlignment(Qt.AlignCenter)
-        self.image_label.setStyleSheet("""
-            QLabel {
-                border: 2px dashed #555555;
-                background-color: #404040;
-                color: #aaaaaa;
-            }
-        """)
-        self.image_label.mousePressEvent = self.select_image
+        self.image_label.installEventFilter(self)  # Clicks open the image picker while editing
         self.scroll_layout.addWidget(self.image_label)
         
+        # Editable fields live in one container so enable/disable is a single setEnabled call
+        self._editable_container = QWidget()
+        fields_layout = QFormLayout(self._editable_container)
+        fields_layout.setContentsMargins(0, 0, 0, 0)
+        fields_layout.setRowWrapPolicy(QFormLayout.WrapAllRows)  # Labels above their fields
+        fields_layout.setFieldGrowthPolicy(QFormLayout.AllNonFixedFieldsGrow)
+        self.scroll_layout.addWidget(self._editable_container)
+        
         # Name field
-        self.scroll_layout.addWidget(QLabel("Name:"))
         self.name_edit = QLineEdit()
-        self.scroll_layout.addWidget(self.name_edit)
+        fields_layout.addRow("Name:", self.name_edit)
         
         # Create parameter fields dynamically
-        self.parameter_edits = {}
-        for param_key in self.empty_profile.available_parameters["dialog"]:
-            display_name = self.empty_profile.get_display_name(param_key, self.language)
-            self.scroll_layout.addWidget(QLabel(f"{display_name}:"))
+        edits = []
+        for param_key, display_name in self.empty_profile.get_dialog_labels(self.language):
             if param_key == "report footer":
                 edit = QTextEdit()
                 edit.setFixedHeight(100)
-                edit.setStyleSheet("QTextEdit { background-color: #404040; border: 1px solid #555555; color: #ffffff; }")
             else:
                 edit = QLineEdit()
-            self.parameter_edits[param_key] = edit
-            self.scroll_layout.addWidget(edit)
+            fields_layout.addRow(f"{display_name}:", edit)
+            edits.append((param_key, edit))
+        self.parameter_edits = dict(edits)  # Parameter edits by key
+        # (key, edit, get_text, set_text) with the text accessors bound once per widget type
+        self._param_fields = tuple(
+            (key, edit, edit.toPlainText, edit.setPlainText) if isinstance(edit, QTextEdit)
+            else (key, edit, edit.text, edit.setText)
+            for key, edit in edits
+        )
         
         # Password fields
-        self.scroll_layout.addWidget(QLabel("Password:"))
         self.password_edit = PasswordInputWidget()
-        self.scroll_layout.addWidget(self.password_edit)
+        self.password_edit.setPlaceholderText("Enter password")
+        fields_layout.addRow("Password:", self.password_edit)
         
-        self.scroll_layout.addWidget(QLabel("Confirm Password:"))
         self.confirm_password_edit = PasswordInputWidget()
-        self.scroll_layout.addWidget(self.confirm_password_edit)
+        self.confirm_password_edit.setPlaceholderText("Confirm password")
+        fields_layout.addRow("Confirm Password:", self.confirm_password_edit)
         
         self.scroll_layout.addStretch()
         
@@ -275,45 +404,49 @@ class ProfilesDialog(QDialog):
         
         self.right_layout.addWidget(scroll_area)
         
-        # Store components for enable/disable functionality
-        self.right_components = [
-            self.save_btn,
-            self.cancel_edit_btn,
-            self.name_edit,
-            self.password_edit,
-            self.confirm_password_edit
-        ]
-        self.right_components.extend(self.parameter_edits.values())
-        
         return self.right_layout
     
+    def ensure_right_layout_built(self):
+        """Build the right panel the first time it is needed"""
+        if self._right_built:
+            return
+        self._right_built = True
+        
+        panel = QWidget()
+        panel.setLayout(self.create_right_layout())
+        self._right_host_layout.removeWidget(self._right_placeholder)
+        self._right_placeholder.hide()
+        self._right_placeholder.deleteLater()
+        self._right_host_layout.addWidget(panel)
+        self._right_placeholder = None
+        self._apply_right_enabled(self.right_enabled)
+    
     def set_right_panel_edit_mode(self, edit_mode):
         """Set border color based on edit mode"""
-        if edit_mode:
-            # Blue border for edit mode - apply only to the right widget itself, not children
-            self.right_widget.setStyleSheet("""
-                QWidget#right_panel {
-                    border: 2px solid #2196F3;
-                    border-radius: 4px;
-                }
-            """)
-            self.right_widget.setObjectName("right_panel")
-        else:
-            # Grey border for normal mode
-            self.right_widget.setStyleSheet("""
-                QWidget#right_panel {
-                    border: 2px solid #555555;
-                    border-radius: 4px;
-                }
-            """)
-            self.right_widget.setObjectName("right_panel")
+        if edit_mode == self._right_panel_edit_mode:
+            return
+        self._right_panel_edit_mode = edit_mode
+        # Blue border while editing, grey otherwise (rules in ui/theme.py); only the panel
+        # itself is re-polished, no stylesheet is parsed
+        self.right_widget.setProperty("editing", bool(edit_mode))
+        style = self.right_widget.style()
+        style.unpolish(self.right_widget)
+        style.polish(self.right_widget)
+        self.right_widget.update()
     
-    def release_image_resources(self):
-        """Release any resources held by the image label to prevent file locking"""
-        try:
-            # Clear the pixmap to release file handles
+    def _clear_preview_widget(self):
+        """Reset the image preview to its empty state"""
+        if self._right_built:
             self.image_label.clear()
             self.image_label.setText("Click to select image")
+    
+    def release_image_resources(self):
+        """Release any resources held by the image label to prevent file locking
+        (only needed right before the shown preview file is overwritten)"""
+        self._clear_preview_widget()
+        if sys.platform != 'win32':
+            return
+        try:
             # Force garbage collection of any lingering QPixmap objects
             import gc
             gc.collect()
@@ -328,54 +461,50 @@ class ProfilesDialog(QDialog):
         if profile is None:
             profile = self.empty_profile
         
-        # Release any existing image resources first
-        self.release_image_resources()
+        # Nothing to show yet: keep the panel unbuilt until a profile is selected or edited
+        if not self._right_built:
+            if profile is self.empty_profile:
+                self.current_profile = profile
+                self.image_path = ""
+                self.original_image_path = ""
+                return
+            self.ensure_right_layout_built()
         
         self.current_profile = profile
         
+        # Suspend painting while every field is rewritten so the panel repaints once
+        self.scroll_widget.setUpdatesEnabled(False)
+        try:
+            self._show_profile_fields(profile)
+        finally:
+            self.scroll_widget.setUpdatesEnabled(True)
+    
+    def _show_profile_fields(self, profile):
+        """Write profile's name, preview, parameters and password state into the right panel"""
+        # Clear the previous preview first
+        self._clear_preview_widget()
+        
         # Update name
-        self.name_edit.setText(profile.name)
+        self._set_edit_text(self.name_edit, profile.name)
         
         # Update image preview and track original path
         if profile.preview_path and os.path.exists(profile.preview_path):
-            # Load image from file data instead of file path to avoid locking
-            with open(profile.preview_path, 'rb') as f:
-                image_data = f.read()
-            
-            pixmap = QPixmap()
-            if pixmap.loadFromData(image_data):
-                scaled_pixmap = pixmap.scaled(
-                    self.image_label.size(),
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
-                )
-                self.image_label.setPixmap(scaled_pixmap)
-                self.image_label.setText("")
-            
             # Track the original image path
             self.image_path = profile.preview_path
             self.original_image_path = profile.preview_path
+            self.show_preview_image(profile.preview_path)
         else:
-            self.image_label.clear()
-            self.image_label.setText("Click to select image")
             self.image_path = ""
             self.original_image_path = ""
         
         # Update parameter fields
-        for param_key, edit in self.parameter_edits.items():
-            current_value = profile.get_value(param_key)
-            if hasattr(edit, 'setPlainText'):
-                if current_value is None:
-                    default_value = profile.get_parameter_info(param_key, "default") or ""
-                    edit.setPlainText(default_value)
-                else:
-                    edit.setPlainText(current_value)
-            else:
-                if current_value is None:
-                    default_value = profile.get_parameter_info(param_key, "default")
-                    edit.setText(default_value if default_value else "")
-                else:
-                    edit.setText(current_value)
+        for param_key, edit, get_text, set_text in self._param_fields:
+            value = profile.get_value(param_key)
+            if value is None:
+                value = self._param_defaults[param_key]
+            if get_text() != value:
+                with QSignalBlocker(edit):
+                    set_text(value)
         
         # Enable/disable password fields based on encrypted_phrase
         password_enabled = profile.encrypted_phrase is None and self.right_enabled
@@ -383,8 +512,15 @@ class ProfilesDialog(QDialog):
         self.confirm_password_edit.setEnabled(password_enabled)
         
         # Clear password fields
-        self.password_edit.setText("")
-        self.confirm_password_edit.setText("")
+        for edit in (self.password_edit, self.confirm_password_edit):
+            if edit.text():
+                edit.clear()
+    
+    def _set_edit_text(self, edit, text):
+        """Set a line edit's text without emitting change signals, skipping it if already equal"""
+        if edit.text() != text:
+            with QSignalBlocker(edit):
+                edit.setText(text)
     
     def refresh_profiles_list(self):
         """Reload profiles from filesystem and update cards list"""
@@ -398,58 +534,80 @@ class ProfilesDialog(QDialog):
         if not self.right_enabled:
             return
             
-        dialog = QFileDialog()
-        image_path, _ = dialog.getOpenFileName(
-            self,
-            "Select Profile Image",
-            "",
-            "Image Files (*.png *.jpg *.jpeg *.bmp *.gif)"
-        )
+        if self._image_dialog is None:
+            self._image_dialog = QFileDialog(self, "Select Profile Image")
+            self._image_dialog.setFileMode(QFileDialog.ExistingFile)
+            self._image_dialog.setNameFilter("Image Files (*.png *.jpg *.jpeg *.bmp *.gif)")
+        
+        image_path = ""
+        if self._image_dialog.exec() == QDialog.Accepted:
+            image_path = next(iter(self._image_dialog.selectedFiles()), "")
         
         if image_path:
-            # Release current image resources before loading new one
-            self.release_image_resources()
+            # Reject non-images from their header bytes, before anything reads the whole file
+            if QImageReader.imageFormat(image_path).isEmpty():
+                QMessageBox.warning(self, "Error", "Could not load image: unsupported image format")
+                return
             
-            self.image_path = image_path
+            # Clear the current preview before loading the new one
+            self._clear_preview_widget()
             
-            # Load image from file data to avoid locking
-            try:
-                with open(image_path, 'rb') as f:
-                    image_data = f.read()
-                
-                pixmap = QPixmap()
-                if pixmap.loadFromData(image_data):
-                    scaled_pixmap = pixmap.scaled(
-                        self.image_label.size(),
-                        Qt.KeepAspectRatio,
-                        Qt.SmoothTransformation
-                    )
-                    self.image_label.setPixmap(scaled_pixmap)
-                    self.image_label.setText("")
-            except Exception as e:
-                QMessageBox.warning(self, "Error", f"Could not load image: {e}")
+            self.image_path = image_path
+            self.show_preview_image(image_path)
+    
+    def show_preview_image(self, image_path):
+        """Show image_path in the preview: straight from the pixmap cache, otherwise
+        decoded and scaled on the thread pool (finished in _on_preview_image_loaded)"""
+        # Decode at device pixels so HiDPI screens get a sharp preview without a rescale
+        ratio = self.image_label.devicePixelRatioF()
+        width = round(self.image_label.width() * ratio)
+        height = round(self.image_label.height() * ratio)
+        try:
+            key = f"profile-preview:{image_path}:{os.path.getmtime(image_path)}:{width}x{height}"
+        except OSError:
+            return  # Removed since it was picked or checked
+        
+        pixmap = QPixmap()
+        if QPixmapCache.find(key, pixmap):
+            self.image_label.setPixmap(pixmap)
+            self.image_label.setText("")
+            return
+        
+        self._pending_preview_key = key
+        self.image_label.setText("Loading image...")
+        # The profile's own preview may be overwritten on save, so Qt must not hold it open
+        from_memory = image_path == self.original_image_path
+        QThreadPool.globalInstance().start(
+            _ScaleImageTask(image_path, width, height, self._image_loader, from_memory))
+    
+    def _on_preview_image_loaded(self, image_path, image, error):
+        """Show a preview image finished on the thread pool (GUI thread)"""
+        if image_path != self.image_path:
+            return  # A newer image was selected (or the edit was cancelled) meanwhile
+        
+        if not error and not image.isNull():
+            pixmap = QPixmap.fromImage(image)
+            pixmap.setDevicePixelRatio(self.image_label.devicePixelRatioF())
+            QPixmapCache.insert(self._pending_preview_key, pixmap)
+            self.image_label.setPixmap(pixmap)
+            self.image_label.setText("")
+            return
+        
+        self.image_label.setText("Click to select image")
+        if error:
+            QMessageBox.warning(self, "Error", f"Could not load image: {error}")
     
     def enable_right_layout(self, enabled):
         """Enable or disable all editable components in right layout"""
-        # Enable/disable right panel components
-        for component in self.right_components:
-            if hasattr(component, 'set_enable'):  # Themed buttons
-                component.set_enable(enabled)
-            elif hasattr(component, 'setEnabled'):  # Line edits and other widgets
-                component.setEnabled(enabled)
-        
-        # Handle image selection separately
-        if enabled:
-            self.image_label.mousePressEvent = self.select_image
-        else:
-            self.image_label.mousePressEvent = lambda event: None
+        if enabled and not self._right_built:
+            self.ensure_right_layout_built()
+            self.refresh_info(self.current_profile)  # Fill the new panel with the pending profile
+        if self._right_built:
+            self._apply_right_enabled(enabled)
             
         # Enable/disable header and footer components (opposite of right panel)
-        for component in self.header_footer_components:
-            if hasattr(component, 'set_enable'):  # Themed buttons
-                component.set_enable(not enabled)
-            elif hasattr(component, 'setEnabled'):  # Standard widgets
-                component.setEnabled(not enabled)
+        for set_enabled in self._header_footer_setters:
+            set_enabled(not enabled)
         
         # Show/hide overlay on left panel
         if enabled:
@@ -464,6 +622,16 @@ class ProfilesDialog(QDialog):
             
         self.right_enabled = enabled
     
+    def _apply_right_enabled(self, enabled):
+        """Enable or disable the widgets of the (built) right panel"""
+        # Themed buttons restyle themselves on enable/disable, the fields follow their container
+        self.save_btn.set_enable(enabled)
+        self.cancel_edit_btn.set_enable(enabled)
+        self._editable_container.setEnabled(enabled)
+        # refresh_info may have disabled the password fields themselves, so set them explicitly
+        self.password_edit.setEnabled(enabled)
+        self.confirm_password_edit.setEnabled(enabled)
+    
     def safe_copy_image(self, source_path, dest_path):
         """Safely copy image file, handling self-copy and file locking"""
         try:
@@ -476,12 +644,22 @@ class ProfilesDialog(QDialog):
                 print(f"Skipping self-copy: {source_path} -> {dest_path}")
                 return True
             
-            # Release any image resources that might lock the file
-            self.release_image_resources()
+            # Same bytes already in place (filecmp compares sizes before reading any data)
+            if os.path.isfile(dest_path) and filecmp.cmp(source_path, dest_path, shallow=False):
+                print(f"Skipping identical copy: {source_path} -> {dest_path}")
+                return True
+            
+            # Release the shown preview if it is the file about to be overwritten
+            if self.original_image_path and dest_abs == os.path.abspath(self.original_image_path):
+                self.release_image_resources()
             
             # Ensure destination directory exists
             os.makedirs(os.path.dirname(dest_path), exist_ok=True)
             
+            # Copy-on-write clone where the filesystem supports it (no data is copied)
+            if _clone_file(source_path, dest_path):
+                return True
+            
             # Copy with retries for Windows file locking
             max_retries = 3
             for attempt in range(max_retries):
@@ -500,6 +678,12 @@ class ProfilesDialog(QDialog):
             return False
     
     # MARK: Profile Actions
+    def get_password_manager(self):
+        """Password manager used to encrypt new profile phrases (created on first use)"""
+        if self._password_manager is None:
+            self._password_manager = PasswordManager(self.profile_manager)
+        return self._password_manager
+    
     def save_profile(self):
         """Save current profile data"""
         try:
@@ -524,11 +708,8 @@ class ProfilesDialog(QDialog):
             
             # Collect profile data
             profile_data = {'name': name}
-            for param_key, edit in self.parameter_edits.items():
-                if hasattr(edit, 'toPlainText'):
-                    profile_data[param_key] = edit.toPlainText().strip()
-                else:
-                    profile_data[param_key] = edit.text().strip()
+            for param_key, edit, get_text, set_text in self._param_fields:
+                profile_data[param_key] = get_text().strip()
             
             # Handle image copying based on edit mode
             image_to_use = None
@@ -548,9 +729,7 @@ class ProfilesDialog(QDialog):
                 profile = self.profile_manager.create_profile(profile_data, image_to_use)
                 
                 # Set password and encrypted phrase
-                time.sleep(0.1)
-                from core.password import PasswordManager
-                password_manager = PasswordManager(self.profile_manager)
+                password_manager = self.get_password_manager()
                 profile.encrypted_phrase = password_manager.encrypt_data(
                     password_manager.validation_phrase, password)
                 profile.save_to_config()
@@ -561,36 +740,30 @@ class ProfilesDialog(QDialog):
             elif self.edit_mode == 'duplicate':
                 # Use proper duplication method that copies database tables
                 if self.source_profile_name:
-                    profile = self.profile_manager.duplicate_profile(self.source_profile_name, profile_data['name'])
-                    
-                    # Update any modified parameter values from the UI
-                    for key, value in profile_data.items():
-                        if key != 'name':  # name is already set by duplicate_profile
-                            profile.set_value(key, value)
-                    
-                    # Handle image if changed
-                    if image_to_use:
-                        profile_dir = os.path.dirname(profile.config_path)
-                        preview_dest = os.path.join(profile_dir, "preview.png")
-                        self.safe_copy_image(image_to_use, preview_dest)
-                        profile.preview_path = preview_dest
-                    
                     # IMPORTANT: Set new password for duplicate profile
+                    encrypted_phrase = None
                     password = self.password_edit.text()
                     if password:  # If new password is provided
-                        time.sleep(0.1)
-                        from core.password import PasswordManager
-                        password_manager = PasswordManager(self.profile_manager)
-                        profile.encrypted_phrase = password_manager.encrypt_data(
+                        password_manager = self.get_password_manager()
+                        encrypted_phrase = password_manager.encrypt_data(
                             password_manager.validation_phrase, password)
                     else:
                         # If no new password provided, use the source profile's password
                         if self.source_profile_name in self.profile_manager.available_profiles:
                             source_profile = self.profile_manager.available_profiles[self.source_profile_name]
-                            profile.encrypted_phrase = source_profile.encrypted_phrase
+                            encrypted_phrase = source_profile.encrypted_phrase
                     
-                    # Save the updated profile
-                    profile.save_to_config()
+                    # Modified parameter values and the password go into the one config write
+                    values = {key: value for key, value in profile_data.items() if key != 'name'}
+                    profile = self.profile_manager.duplicate_profile(
+                        self.source_profile_name, profile_data['name'], values, encrypted_phrase)
+                    
+                    # Handle image if changed (the preview path is not part of the config)
+                    if image_to_use:
+                        profile_dir = os.path.dirname(profile.config_path)
+                        preview_dest = os.path.join(profile_dir, "preview.png")
+                        self.safe_copy_image(image_to_use, preview_dest)
+                        profile.preview_path = preview_dest
                 else:
                     # Fallback to regular creation if source profile not found
                     profile = self.profile_manager.create_profile(profile_data, image_to_use)
@@ -601,9 +774,14 @@ class ProfilesDialog(QDialog):
             elif self.edit_mode == 'edit':
                 self.profile_manager.update_profile(self.current_profile.name, profile_data, image_to_use)
                 # Keep the same selected profile (it was updated)
-                
-            # Refresh the profiles list
-            self.refresh_profiles_list()
+                profile = self.profile_manager.available_profiles[self.current_profile.name]
+            
+            # The profile manager already holds the saved profile, so only its card needs updating
+            if self.edit_mode in ['new', 'duplicate']:
+                self.cards_list.create_card(label_text=profile.name, card_id=profile.name,
+                                            preview_path=profile.preview_path)
+            elif self.edit_mode == 'edit':
+                self.cards_list.refresh_card(profile.name, profile.preview_path)
             self.enable_right_layout(False)
             self.source_profile_name = None  # Reset source profile name
             
@@ -632,18 +810,18 @@ class ProfilesDialog(QDialog):
         
     def browse_profiles_path(self):
         """Open directory dialog to select profiles folder"""
-        dialog = QFileDialog()
-        dialog.setFileMode(QFileDialog.Directory)
-        dialog.setOption(QFileDialog.ShowDirsOnly, True)
+        if self._dir_dialog is None:
+            self._dir_dialog = QFileDialog(self, "Select Profiles Directory")
+            self._dir_dialog.setFileMode(QFileDialog.Directory)
+            self._dir_dialog.setOption(QFileDialog.ShowDirsOnly, True)
         
         # Start from current profiles path or home directory
-        start_dir = self.profiles_path if os.path.exists(self.profiles_path) else os.path.expanduser("~")
+        start_dir = self.profiles_path if os.path.exists(self.profiles_path) else _HOME
+        self._dir_dialog.setDirectory(start_dir)
         
-        selected_dir = dialog.getExistingDirectory(
-            self, 
-            "Select Profiles Directory", 
-            start_dir
-        )
+        selected_dir = ""
+        if self._dir_dialog.exec() == QDialog.Accepted:
+            selected_dir = next(iter(self._dir_dialog.selectedFiles()), "")
         
         # Update path if user selected a directory (not cancelled)
         if selected_dir:
@@ -698,8 +876,12 @@ class ProfilesDialog(QDialog):
             self.edit_mode = 'duplicate'
             self.source_profile_name = source_profile.name  # Store source profile name
             
-            # Create a copy with modified name
-            duplicate_profile = ProfileClass(f"{source_profile.name}_copy")
+            # Fill the reusable display copy with the source's values under a modified name
+            # (each parameter keeps its own dict, so editing the copy never touches the source)
+            if self._duplicate_profile is None:
+                self._duplicate_profile = ProfileClass("")
+            duplicate_profile = self._duplicate_profile
+            duplicate_profile.name = f"{source_profile.name}_copy"
             for key, param in source_profile.parameters.items():
                 duplicate_profile.parameters[key]["value"] = param["value"]
             duplicate_profile.preview_path = source_profile.preview_path
@@ -739,7 +921,7 @@ class ProfilesDialog(QDialog):
                     if was_selected:
                         self.profile_manager.selected_profile = None
                     
-                    self.refresh_profiles_list()
+                    self.cards_list.remove_card(card_id)
                     QMessageBox.information(self, "Success", "Profile deleted successfully.")
                 except Exception as e:
                     QMessageBox.critical(self, "Error", f"Failed to delete profile: {str(e)}")
@@ -15,12 +15,12 @@ class LogTab(QWidget):
         
         # Placeholder content
         label = QLabel("Log Tab - Coming Soon")
-        label.setStyleSheet("color: #ffffff; font-size: 16px;")
+        label.setObjectName("log_placeholder")  # Styled by the app-wide sheet (ui/theme.py)
         layout.addWidget(label)
         
         if self.database:
             db_label = QLabel(f"Database connected: {self.database is not None}")
-            db_label.setStyleSheet("color: #00ff00; font-size: 12px;")
+            db_label.setObjectName("log_db_status")
             layout.addWidget(db_label)
         
         self.setLayout(layout)
\ No newline at end of file
@@ -0,0 +1,73 @@
+"""
+Application-wide dark theme - stylesheet installed once on the QApplication,
+plus a shared palette for the colour-only parts of the theme
+"""
+from functools import lru_cache
+
+from PySide6.QtGui import QColor, QPalette
+
+
+# Rules are scoped by dialog (or tab) class name so they only reach the widgets that
+# used to carry them as their own stylesheets. The dialog window colours come from
+# dark_palette(); labels keep a rule because panels with their own stylesheet
+# (and disabled labels) do not pick up a parent's palette colours.
+DARK_QSS = """
+    ProfilesDialog QLabel#profiles_header {
+        font-size: 18px;
+        font-weight: bold;
+    }
+    ProfilesDialog QWidget#profiles_overlay {
+        background-color: rgba(0, 0, 0, 120);
+        border-radius: 5px;
+    }
+    ProfilesDialog QWidget#right_panel {
+        border: 2px solid #555555;
+        border-radius: 4px;
+    }
+    ProfilesDialog QWidget#right_panel[editing="true"] {
+        border-color: #2196F3;
+    }
+    ProfilesDialog QScrollArea {
+        background-color: #2b2b2b;
+        border: none;
+    }
+    ProfilesDialog QLabel {
+        color: #ffffff;
+    }
+    ProfilesDialog _ImageDropLabel {
+        color: #aaaaaa;
+    }
+    ProfilesDialog QLineEdit {
+        background-color: #404040;
+        border: 1px solid #555555;
+        padding: 5px;
+        color: #ffffff;
+    }
+    ProfilesDialog QTextEdit {
+        background-color: #404040;
+        border: 1px solid #555555;
+        color: #ffffff;
+    }
+    ProfilesDialog QLineEdit:disabled {
+        background-color: #2a2a2a;
+        border: 1px solid #333333;
+        color: #666666;
+    }
+    LogTab QLabel#log_placeholder {
+        color: #ffffff;
+        font-size: 16px;
+    }
+    LogTab QLabel#log_db_status {
+        color: #00ff00;
+        font-size: 12px;
+    }
+"""
+
+
+@lru_cache(maxsize=1)
+def dark_palette():
+    """Dark window/text palette, built once and shared by every dialog that uses it"""
+    palette = QPalette()
+    palette.setColor(QPalette.Window, QColor("#2b2b2b"))
+    palette.setColor(QPalette.WindowText, QColor("#ffffff"))
+    return palette
@@ -58,6 +58,8 @@ class ClickableCard(QWidget):
     
     def set_selected(self, selected=True):
         """Set selected state"""
+        if selected == self._selected:
+            return
         self._selected = selected
         self._update_style()
     
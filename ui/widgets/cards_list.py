@@ -1,9 +1,14 @@
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QScrollArea
 from PySide6.QtCore import Qt, QTimer
 from .card_widgets import SquareCard
+from collections import namedtuple
 import uuid
 
 
+# A grid card that has not been scrolled into view yet, so no widget exists for it
+_PendingCard = namedtuple("_PendingCard", "card_id label_text preview_path")
+
+
 class BaseCardsList(QWidget):
     """Base class for managing collections of cards with different layouts"""
     
@@ -89,6 +94,11 @@ class BaseCardsList(QWidget):
         """Add card to the layout - implement in subclasses"""
         pass
     
+    def refresh_card(self, card_id, preview_path=None):
+        """Reload a card's preview after its profile was saved"""
+        if card_id in self.cards:
+            self.cards[card_id].set_preview_path(preview_path)
+    
     def remove_card(self, card_id):
         """Remove a card from the list"""
         if card_id in self.cards:
@@ -106,6 +116,9 @@ class BaseCardsList(QWidget):
     
     def select_card(self, card_id):
         """Select a card and update visual states"""
+        if card_id == self.selected_card:
+            return  # Already in this state (e.g. deselecting with nothing selected)
+        
         # Deselect previous card
         if self.selected_card and self.selected_card in self.cards:
             self.cards[self.selected_card].set_selected(False)
@@ -189,7 +202,9 @@ class _GridCardsList(BaseCardsList):
         self.card_size = card_size
         self.min_spacing = min_spacing
         self.min_layout_width = card_size + (min_spacing * 2)
-        self.cards_order = []  # Track card order for grid positioning
+        self.cards_order = []  # Track card order for grid positioning (cards or _PendingCard entries)
+        self.scroll_area = None  # Set by GridCardsList; only cards inside its viewport are shown
+        self._grid_geometry = None  # (cards_per_row, horizontal_margin) from the last layout pass
         super().__init__(category, card_type, add_available, parent)
     
     def setup_ui(self):
@@ -206,8 +221,48 @@ class _GridCardsList(BaseCardsList):
         self.layout_timer.timeout.connect(self._update_grid_layout)
         self.layout_timer.setSingleShot(True)
     
+    def load_cards(self):
+        """Reload cards, dropping entries that never got a widget"""
+        self.cards_order = [entry for entry in self.cards_order if not isinstance(entry, _PendingCard)]
+        super().load_cards()
+    
+    def create_card(self, label_text, card_id=None, preview_path=None):
+        """Queue a card; its widget is only built once it scrolls into view"""
+        if card_id is None:
+            card_id = str(uuid.uuid4())
+        
+        self.cards_order.append(_PendingCard(card_id, label_text, preview_path))
+        self.layout_timer.start(50)
+        return card_id
+    
+    def remove_card(self, card_id):
+        """Remove a card from the list, whether or not its widget exists yet"""
+        for index, entry in enumerate(self.cards_order):
+            if isinstance(entry, _PendingCard) and entry.card_id == card_id:
+                del self.cards_order[index]
+                self.layout_timer.start(50)
+                if self.selected_card == card_id:
+                    self.selected_card = None
+                return
+        super().remove_card(card_id)
+    
+    def _build_card(self, index, pending):
+        """Create the widget for a queued card in place"""
+        card = self.card_type(pending.label_text, parent=self, category=self.category)
+        card.id = pending.card_id
+        if pending.preview_path:
+            card.set_preview_path(pending.preview_path)
+        card.setParent(self.grid_container)
+        if self.selected_card == card.id:
+            card.set_selected(True)
+        
+        self.cards[card.id] = card
+        self.cards_order[index] = card
+        return card
+    
     def add_card_to_layout(self, card, is_add_card=False):
         card.setParent(self.grid_container)
+        card.hide()  # Shown by the grid layout once it is known to be on screen
         if is_add_card:
             self.cards_order.insert(0, card)  # Add card goes first
         else:
@@ -244,27 +299,48 @@ class _GridCardsList(BaseCardsList):
         total_spacing_width = (cards_per_row - 1) * self.min_spacing
         extra_space = available_width - total_cards_width - total_spacing_width
         horizontal_margin = extra_space // 2 + self.min_spacing
+        self._grid_geometry = (cards_per_row, horizontal_margin)
         
-        # Position cards in grid
-        row = 0
-        col = 0
-        
-        for card in self.cards_order:
-            x = horizontal_margin + col * (self.card_size + self.min_spacing)
-            y = self.min_spacing + row * (self.card_size + self.min_spacing)
-            
-            card.move(x, y)
-            card.show()
-            
-            col += 1
-            if col >= cards_per_row:
-                col = 0
-                row += 1
+        # Position the cards that already have widgets
+        for index, card in enumerate(self.cards_order):
+            if not isinstance(card, _PendingCard):
+                card.move(*self._card_position(index))
         
         # Update container height based on rows needed
         total_rows = (len(self.cards_order) + cards_per_row - 1) // cards_per_row
         container_height = max(100, total_rows * (self.card_size + self.min_spacing) + self.min_spacing)
         self.grid_container.setFixedHeight(container_height)
+        self.update_visible_cards()
+    
+    def _card_position(self, index):
+        """Top-left corner of the grid cell at index"""
+        cards_per_row, horizontal_margin = self._grid_geometry
+        row, col = divmod(index, cards_per_row)
+        return (horizontal_margin + col * (self.card_size + self.min_spacing),
+                self.min_spacing + row * (self.card_size + self.min_spacing))
+    
+    def update_visible_cards(self):
+        """Show only the cards inside (or one row beyond) the scroll viewport, building
+        widgets for queued cards as they come into view, and hide the rest"""
+        if self._grid_geometry is None:
+            return  # Not laid out yet
+        
+        if self.scroll_area is None:
+            top, bottom = float("-inf"), float("inf")
+        else:
+            margin = self.card_size + self.min_spacing
+            top = self.scroll_area.verticalScrollBar().value() - self.grid_container.y() - margin
+            bottom = top + self.scroll_area.viewport().height() + 2 * margin
+        
+        for index, card in enumerate(self.cards_order):
+            x, y = self._card_position(index)
+            visible = top <= y + self.card_size and y <= bottom
+            if isinstance(card, _PendingCard):
+                if not visible:
+                    continue
+                card = self._build_card(index, card)
+                card.move(x, y)
+            card.setVisible(visible)
 
 
 # Scrollable wrapper classes
@@ -308,6 +384,8 @@ class GridCardsList(QScrollArea):
     def __init__(self, category = None, card_type=SquareCard, add_available=True, card_size=120, min_spacing=10, parent=None):
         super().__init__(parent)
         self.cards_list = _GridCardsList(category, card_type, add_available, card_size, min_spacing, parent)
+        self.cards_list.scroll_area = self
+        self.verticalScrollBar().valueChanged.connect(self.cards_list.update_visible_cards)
         
         self.setWidget(self.cards_list)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
@@ -353,11 +353,16 @@ class TableEventHandler:
                 item = QTableWidgetItem()
                 self.table.setItem(row, col, item)
             
+            had_name = bool(item.text().strip())
             self._updating = True
             item.setText(text)
             self._updating = False
         except (ValueError, IndexError):
-            pass
+            return
+        
+        # Naming or clearing a row moves it in or out of the totals
+        if had_name != bool(text.strip()):
+            self.items_changed_callback()
     
     def _on_product_selection_finished(self, row):
         """Handle when product selection is completed"""
@@ -464,6 +469,17 @@ class TableEventHandler:
         except (ValueError, AttributeError, IndexError):
             pass
     
+    def get_row_subtotal(self, row):
+        """Get the subtotal currently shown for a row (0.0 if empty or missing)"""
+        try:
+            subtotal_col = self.data_manager.table_columns.index('subtotal')
+            subtotal_item = self.table.item(row, subtotal_col)
+            if subtotal_item and subtotal_item.text().strip():
+                return float(subtotal_item.text())
+        except ValueError:
+            pass
+        return 0.0
+    
     def _reconnect_all_widgets(self):
         """Reconnect all widget events after table changes"""
         for row in range(self.table.rowCount()):
@@ -752,6 +768,9 @@ class OperationsTableWidget(QWidget):
         # Ensure empty row
         self.empty_row_manager.ensure_single_empty_row()
         
+        # Snapshot of loaded rows, used by has_changes()
+        self._loaded_rows = self.get_current_table_data()
+        
         # Setup events
         self.event_handler.setup_event_connections()
         # Initial validation so existing rows show state immediately (only if enabled)
@@ -779,6 +798,10 @@ class OperationsTableWidget(QWidget):
         
         return items_data
 
+    def has_changes(self):
+        """Check if table rows differ from the ones loaded from the operation"""
+        return self.get_current_table_data() != self._loaded_rows
+    
     def get_all_entered_product_names(self):
         """Return every product_name typed by user (even if product does not exist yet).
         Excludes the final empty row."""
@@ -799,6 +822,12 @@ class OperationsTableWidget(QWidget):
                     names.append(text)
         return names
     
+    def get_subtotal_column(self):
+        """Get the subtotal of every filled row as a flat list of floats (no item objects)"""
+        get_product_name = self.empty_row_manager._get_product_name
+        get_row_subtotal = self.event_handler.get_row_subtotal
+        return [get_row_subtotal(row) for row in range(self.table.rowCount()) if get_product_name(row)]
+    
     def get_items_data(self):
         """Get items as object instances (compatibility method)"""
         items = []
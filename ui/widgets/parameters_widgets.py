@@ -510,25 +510,36 @@ class ParameterWidgetFactory:
     @staticmethod
     def set_widget_value(widget, value):
         """Set value on any parameter widget"""
+        ParameterWidgetFactory.get_value_setter(widget)(value)
+    
+    @staticmethod
+    def get_value_setter(widget):
+        """Resolve the callable that sets a value on this widget (resolve once, call many times)"""
         if isinstance(widget, NumericWidget):
-            widget.setValue(value)
+            return widget.setValue
         elif hasattr(widget, 'checkbox') and isinstance(widget.checkbox, QCheckBox):
             if hasattr(widget, 'setValue'):
-                widget.setValue(value)
+                return widget.setValue
+            return _ignore_value
         elif isinstance(widget, StringWidget):
-            widget.setText(value)
+            return widget.setText
         elif isinstance(widget, ImageWidget):
-            widget.set_image_path(value, copy_to_profile=False)
+            return lambda value: widget.set_image_path(value, copy_to_profile=False)
         elif isinstance(widget, DateWidget):
-            widget.setDate(value)
+            return widget.setDate
         elif isinstance(widget, ButtonWidget):
-            pass  # Buttons don't have settable values
+            return _ignore_value  # Buttons don't have settable values
         else:
             # Fallback for unknown widget types
             if hasattr(widget, 'setText'):
-                widget.setText(str(value) if value is not None else '')
+                return lambda value: widget.setText(str(value) if value is not None else '')
             elif hasattr(widget, 'setValue'):
-                widget.setValue(float(value) if value is not None else 0)
+                return lambda value: widget.setValue(float(value) if value is not None else 0)
+            return _ignore_value
+
+
+def _ignore_value(value):
+    """Setter for widgets that have no settable value"""
 
 
 # Test widget for sales table - as requested
@@ -9,15 +9,49 @@ preview.update_size(150)  # Optional: update size later
     
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QPixmap, QFont
+from PySide6.QtGui import QPixmap, QPixmapCache, QFont, QImageReader
 import os
 
 
+def scale_for_preview(image, width, height):
+    """Scale a QPixmap/QImage to fit width x height for display.
+    Large sources are first shrunk cheaply to twice the target, so the smooth
+    filter only runs over a small image."""
+    if image.width() > 2 * width and image.height() > 2 * height:
+        image = image.scaled(2 * width, 2 * height, Qt.KeepAspectRatio, Qt.FastTransformation)
+    return image.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+def cached_preview_pixmap(path, width, height):
+    """Get path scaled to width x height from the app-wide QPixmapCache, loading it on a miss.
+    Returns a null QPixmap if the file cannot be loaded."""
+    key = f"preview:{path}:{os.path.getmtime(path)}:{width}x{height}"
+    pixmap = QPixmap()
+    if QPixmapCache.find(key, pixmap):
+        return pixmap
+    
+    # Decode straight to the preview size instead of decoding the full image first
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    source_size = reader.size()
+    if source_size.isValid():
+        reader.setScaledSize(source_size.scaled(width, height, Qt.KeepAspectRatio))
+    image = reader.read()
+    if image.isNull():
+        return QPixmap()
+    if not source_size.isValid():
+        image = scale_for_preview(image, width, height)
+    pixmap = QPixmap.fromImage(image)
+    QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
 class PreviewWidget(QWidget):
     def __init__(self, size=64, category="individual", parent=None):
         super().__init__(parent)
         self.category = category
         self._image_path = None
+        self._content_stale = False  # Content changed while hidden, refresh on next show
         
         self._set_size(size)
         self.setup_ui()
@@ -74,21 +108,27 @@ class PreviewWidget(QWidget):
     
     def _refresh_content(self):
         """Refresh the displayed content based on current state"""
+        if not self.isVisible():
+            # Defer image decoding until the widget is actually shown
+            self._content_stale = True
+            return
+        self._content_stale = False
         if self._image_path and os.path.exists(self._image_path):
             self._display_image(self._image_path)
         else:
             self._display_fallback()
     
+    def showEvent(self, event):
+        """Catch up on content changes made while hidden"""
+        super().showEvent(event)
+        if self._content_stale:
+            self._refresh_content()
+    
     def _display_image(self, path):
         """Display scaled image"""
-        pixmap = QPixmap(path)
-        if not pixmap.isNull():
-            # Scale to fit widget size minus border padding
-            scaled_width = self.width - 6
-            scaled_height = self.height - 6
-            scaled_pixmap = pixmap.scaled(scaled_width, scaled_height, 
-                                        Qt.KeepAspectRatio, 
-                                        Qt.SmoothTransformation)
+        # Scale to fit widget size minus border padding
+        scaled_pixmap = cached_preview_pixmap(path, self.width - 6, self.height - 6)
+        if not scaled_pixmap.isNull():
             self.content_label.setPixmap(scaled_pixmap)
             self.content_label.setText("")
     
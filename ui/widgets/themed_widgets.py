@@ -393,6 +393,9 @@ class PasswordInputWidget(QWidget):
     def setPlaceholderText(self, text):
         self.password_input.setPlaceholderText(text)
     
+    def clear(self):
+        self.password_input.clear()
+    
     def setFocus(self):
         self.password_input.setFocus()
     